@@ -4,10 +4,13 @@ Analytics API routes for model usage and performance metrics.
 
 import logging
 import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
 
+from backend.core.usage_tracker import paginate_billing_usage
 from backend.core.venice_api_client import VeniceAPIClient
 from backend.config import get_settings, Settings
 from backend.models.schemas import (
@@ -28,8 +31,40 @@ def get_venice_client(settings: Settings = Depends(get_settings)) -> VeniceAPICl
     return VeniceAPIClient(settings.VENICE_ADMIN_KEY)
 
 
+# Extended-format ISO-8601 timestamp as returned by /billing/usage, e.g.
+# 2026-03-04T12:34:56.789Z. Anchored so the date prefix can be sliced directly.
+# Days 29-31 depend on the month, so those fall through to the full parse.
+_EXTENDED_ISO_RE = re.compile(
+    r'\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])'
+    r'(?:[T ](?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d{1,6})?)?'
+    r'(?:Z|[+-](?:[01]\d|2[0-3]):?[0-5]\d)?)?'
+)
+
+
+def _iso_date_key(timestamp: str) -> Optional[str]:
+    """Return the ``YYYY-MM-DD`` bucket for an ISO-8601 timestamp, or None if unparseable.
+
+    Buckets use the timestamp's own date (no timezone conversion), so the usual
+    extended-format strings are sliced without building a datetime. Anything
+    else falls back to a full parse.
+    """
+    if _EXTENDED_ISO_RE.fullmatch(timestamp):
+        return timestamp[:10]
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+_IMAGE_SKU_RE = re.compile(r'-image-unit|-fixed-.*img|-edit-fixed-')
+
+
+@lru_cache(maxsize=1024)
 def detect_model_type(sku: str) -> str:
-    """Detect the model type (llm, image, video, music, embedding, other) from SKU."""
+    """Detect the model type (llm, image, video, music, embedding, other) from SKU.
+
+    Memoised: billing pages repeat a small set of SKUs thousands of times.
+    """
     s = sku.lower()
 
     if s == 'credit-purchase':
@@ -48,7 +83,7 @@ def detect_model_type(sku: str) -> str:
         return 'embedding'
 
     # Image: *-image-unit, *-fixed-*img, *-edit-fixed-*
-    if re.search(r'-image-unit|-fixed-.*img|-edit-fixed-', s):
+    if _IMAGE_SKU_RE.search(s):
         return 'image'
 
     # LLM: *-llm-{input|output|cache-*}-mtoken
@@ -62,6 +97,33 @@ def detect_model_type(sku: str) -> str:
     return 'other'
 
 
+# First match wins; each pattern captures the model name in group 1.
+_MODEL_NAME_PATTERNS = tuple(re.compile(p) for p in (
+    # --- Video: {model}-text-to-video-* ---
+    r'^(.+?)-text-to-video-',
+    # --- Music (checked before generic -fixed- to avoid false matches) ---
+    # elevenlabs-music-duration-based-{60s|120s|240s}
+    r'^(elevenlabs-music)-duration-based-',
+    # minimax-music-v2-fixed
+    r'^(minimax-music-v2)-fixed',
+    # ace-step-15-duration-based-*
+    r'^(ace-step-[\d.]+)-duration-based-',
+    # stable-audio-25-fixed-*
+    r'^(stable-audio-[\d.]+)-fixed-',
+    # --- Embedding: text-embedding-{name}-llm-{input|output}-mtoken ---
+    r'^(text-embedding-.+?)-llm-(?:input|output)-mtoken',
+    # --- LLM: {model}-llm-{extended-}?{variant}-mtoken ---
+    r'^(.+?)-llm-(?:extended-)?(?:cache-write(?:-5m)?|cache-input|input|output)-mtoken',
+    # --- Image: {model}-image-unit ---
+    r'^(.+?)-image-unit',
+    # --- Image edit: {model}-edit-fixed-* ---
+    r'^(.+?)-edit-fixed-',
+    # --- Image fixed: {model}-fixed-{1K-}?{websearch-}?{N}img ---
+    r'^(.+?)-fixed-(?:\d+[Kk]-)?(?:websearch-)?\d*img',
+))
+
+
+@lru_cache(maxsize=1024)
 def clean_model_name(sku: str) -> str:
     """Extract clean model name from SKU.
 
@@ -79,56 +141,10 @@ def clean_model_name(sku: str) -> str:
     if s == 'credit-purchase':
         return 'credit-purchase'
 
-    # --- Video: {model}-text-to-video-* ---
-    m = re.match(r'^(.+?)-text-to-video-', s)
-    if m:
-        return m.group(1)
-
-    # --- Music (checked before generic -fixed- to avoid false matches) ---
-    # elevenlabs-music-duration-based-{60s|120s|240s}
-    m = re.match(r'^(elevenlabs-music)-duration-based-', s)
-    if m:
-        return m.group(1)
-    # minimax-music-v2-fixed
-    m = re.match(r'^(minimax-music-v2)-fixed', s)
-    if m:
-        return m.group(1)
-    # ace-step-15-duration-based-*
-    m = re.match(r'^(ace-step-[\d.]+)-duration-based-', s)
-    if m:
-        return m.group(1)
-    # stable-audio-25-fixed-*
-    m = re.match(r'^(stable-audio-[\d.]+)-fixed-', s)
-    if m:
-        return m.group(1)
-
-    # --- Embedding: text-embedding-{name}-llm-{input|output}-mtoken ---
-    m = re.match(r'^(text-embedding-.+?)-llm-(?:input|output)-mtoken', s)
-    if m:
-        return m.group(1)
-
-    # --- LLM: {model}-llm-{extended-}?{variant}-mtoken ---
-    m = re.match(
-        r'^(.+?)-llm-(?:extended-)?(?:cache-write(?:-5m)?|cache-input|input|output)-mtoken',
-        s,
-    )
-    if m:
-        return m.group(1)
-
-    # --- Image: {model}-image-unit ---
-    m = re.match(r'^(.+?)-image-unit', s)
-    if m:
-        return m.group(1)
-
-    # --- Image edit: {model}-edit-fixed-* ---
-    m = re.match(r'^(.+?)-edit-fixed-', s)
-    if m:
-        return m.group(1)
-
-    # --- Image fixed: {model}-fixed-{1K-}?{websearch-}?{N}img ---
-    m = re.match(r'^(.+?)-fixed-(?:\d+[Kk]-)?(?:websearch-)?\d*img', s)
-    if m:
-        return m.group(1)
+    for pattern in _MODEL_NAME_PATTERNS:
+        m = pattern.match(s)
+        if m:
+            return m.group(1)
 
     # Fallback: return as-is
     return s
@@ -144,7 +160,7 @@ def process_usage_data(usage_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
     model_data: Dict[str, Dict] = {}
     request_tracker: Dict[str, set] = {}
 
-    logger.info(f"Processing {len(usage_entries)} usage entries")
+    logger.info("Processing %d usage entries", len(usage_entries))
 
     for entry in usage_entries:
         sku = entry.get('sku', 'unknown')
@@ -158,7 +174,10 @@ def process_usage_data(usage_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
 
         model_name = clean_model_name(sku)
         model_type = detect_model_type(sku)
-        logger.debug(f"SKU: {sku} -> Model: {model_name}, Type: {model_type}, Amount: {abs_amount}, Currency: {currency}")
+        logger.debug(
+            "SKU: %s -> Model: %s, Type: %s, Amount: %s, Currency: %s",
+            sku, model_name, model_type, abs_amount, currency,
+        )
 
         if model_name not in model_data:
             model_data[model_name] = {
@@ -169,7 +188,9 @@ def process_usage_data(usage_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
                 'cost': 0.0,          # legacy mixed; prefer cost_usd + cost_diem
                 'cost_usd': 0.0,
                 'cost_diem': 0.0,
-                'response_times': [],
+                # Running total/count so the mean is closed-form at the end.
+                'response_time_total': 0.0,
+                'response_time_count': 0,
                 'model_type': model_type,
             }
             request_tracker[model_name] = set()
@@ -195,7 +216,8 @@ def process_usage_data(usage_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
             if is_new_request:
                 exec_time = inference.get('inferenceExecutionTime')
                 if exec_time:
-                    model_data[model_name]['response_times'].append(exec_time)
+                    model_data[model_name]['response_time_total'] += exec_time
+                    model_data[model_name]['response_time_count'] += 1
 
         # Separate by currency (BUG-05). Use abs for "cost" semantics.
         model_data[model_name]['cost'] += abs_amount
@@ -207,16 +229,23 @@ def process_usage_data(usage_entries: List[Dict[str, Any]]) -> Dict[str, Any]:
             # Unknown/other currencies contribute to legacy 'cost' only
             pass
 
-    logger.info(f"Found {len(model_data)} models with data")
+    logger.info("Found %d models with data", len(model_data))
 
-    for model_name, data in model_data.items():
-        times = data['response_times']
-        data['avg_response_time_ms'] = sum(times) / len(times) if times else 0.0
-        del data['response_times']
+    for data in model_data.values():
+        count = data.pop('response_time_count')
+        total = data.pop('response_time_total')
+        data['avg_response_time_ms'] = total / count if count else 0.0
 
     return model_data
 
 
+# Recommendation thresholds.
+_EFFICIENCY_GAP_RATIO = 0.5  # cheapest model costs under half the priciest per 1K tokens
+_HIGH_LATENCY_MS = 5000
+_DOMINANT_COST_RATIO = 0.5  # top model's cost vs. the sum of all other models
+_MAX_RECOMMENDATIONS = 5
+
+
 def generate_recommendations(model_data: Dict[str, Dict]) -> List[Dict[str, str]]:
     """Generate actionable recommendations based on usage patterns."""
     recommendations = []
@@ -234,7 +263,7 @@ def generate_recommendations(model_data: Dict[str, Dict]) -> List[Dict[str, str]
         most_efficient = sorted_by_efficiency[0]
         least_efficient = sorted_by_efficiency[-1]
         
-        if most_efficient[1] < least_efficient[1] * 0.5:
+        if most_efficient[1] < least_efficient[1] * _EFFICIENCY_GAP_RATIO:
             recommendations.append({
                 'type': 'efficiency',
                 'message': f"'{most_efficient[0]}' is most cost-efficient (${most_efficient[1]:.4f}/1K tokens)",
@@ -242,7 +271,8 @@ def generate_recommendations(model_data: Dict[str, Dict]) -> List[Dict[str, str]
             })
     
     for model, data in model_data.items():
-        if data['avg_response_time_ms'] > 5000:
+        # usage-analytics does not report latency (None); only the billing fallback does.
+        if (data.get('avg_response_time_ms') or 0) > _HIGH_LATENCY_MS:
             recommendations.append({
                 'type': 'performance',
                 'message': f"'{model}' has high latency ({data['avg_response_time_ms']/1000:.1f}s avg)",
@@ -252,14 +282,14 @@ def generate_recommendations(model_data: Dict[str, Dict]) -> List[Dict[str, str]
     sorted_by_usage = sorted(model_data.items(), key=lambda x: x[1]['cost'], reverse=True)
     if len(sorted_by_usage) > 1:
         top_model = sorted_by_usage[0]
-        if top_model[1]['cost'] > sum(d['cost'] for _, d in sorted_by_usage[1:]) * 0.5:
+        if top_model[1]['cost'] > sum(d['cost'] for _, d in sorted_by_usage[1:]) * _DOMINANT_COST_RATIO:
             recommendations.append({
                 'type': 'cost',
                 'message': f"'{top_model[0]}' accounts for {top_model[1]['cost']:.2f} DIEM usage",
                 'priority': 'high'
             })
     
-    return recommendations[:5]
+    return recommendations[:_MAX_RECOMMENDATIONS]
 
 
 async def _fetch_usage_analytics(
@@ -275,7 +305,7 @@ async def _fetch_usage_analytics(
         }
         response = await client.get('/billing/usage-analytics', params=params)
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
     except Exception as exc:
         logger.debug("usage-analytics endpoint unavailable: %s", exc)
     return None
@@ -320,11 +350,18 @@ async def get_model_analytics(
                     )
                     for b in model.get('breakdown', [])
                 ]
+                prompt_tokens = completion_tokens = 0
+                for b in breakdown:
+                    btype = (b.type or '').lower()
+                    if btype == 'input':
+                        prompt_tokens += b.units
+                    elif btype == 'output':
+                        completion_tokens += b.units
                 model_usage[name] = ModelAnalytics(
                     requests=None,  # BUG-08: usage-analytics does not expose request counts
                     tokens=units,
-                    prompt_tokens=sum(b.units for b in breakdown if (b.type or '').lower() == 'input'),
-                    completion_tokens=sum(b.units for b in breakdown if (b.type or '').lower() == 'output'),
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
                     cost=cost,
                     cost_usd=cost_usd,
                     cost_diem=cost_diem,
@@ -355,29 +392,15 @@ async def get_model_analytics(
                 source='billing/usage-analytics',
             )
 
-        usage_entries = []
-        page = 1
-        max_pages = settings.API_MAX_PAGES
-        while page <= max_pages:
-            params = {
-                'startDate': start_date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
-                'endDate': end_date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
-                'limit': settings.API_PAGE_SIZE,
-                'sortOrder': 'desc',
-                'page': page,
-            }
-            response = await client.get('/billing/usage', params=params)
-            if response.status_code >= 400:
-                response.raise_for_status()
-            data = response.json()
-            page_entries = data.get('data', [])
-            usage_entries.extend(page_entries)
-            pagination = data.get('pagination', {})
-            total_pages = int(pagination.get('totalPages', response.headers.get('x-pagination-total-pages', 1)))
-            if page >= total_pages:
-                break
-            page += 1
-        logger.info(f"Analytics /models fetched {len(usage_entries)} billing entries across {page} page(s) for last {days} day(s)")
+        usage_entries = await paginate_billing_usage(
+            client,
+            start_date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            end_date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            sort_order='desc',
+        )
+        logger.info(
+            "Analytics /models fetched %s billing entries for last %s day(s)", len(usage_entries), days
+        )
         
         model_data = process_usage_data(usage_entries)
         
@@ -392,7 +415,13 @@ async def get_model_analytics(
             )
         
         model_analytics = {}
+        total_requests = 0
+        total_tokens = 0
+        total_cost = 0.0
         for model_name, mdata in model_data.items():
+            total_requests += mdata['requests']
+            total_tokens += mdata['tokens']
+            total_cost += mdata['cost']
             model_analytics[model_name] = ModelAnalytics(
                 requests=mdata['requests'],
                 tokens=mdata['tokens'],
@@ -403,10 +432,6 @@ async def get_model_analytics(
                 model_type=mdata.get('model_type', 'other'),
             )
         
-        total_requests = sum(d['requests'] for d in model_data.values())
-        total_tokens = sum(d['tokens'] for d in model_data.values())
-        total_cost = sum(d['cost'] for d in model_data.values())
-        
         recommendations = generate_recommendations(model_data)
         
         return AnalyticsResponse(
@@ -453,11 +478,11 @@ async def get_daily_analytics(
                 diem = entry.get('diem') or entry.get('totalDiem') or 0
                 try:
                     usd_f = float(usd)
-                except Exception:
+                except (TypeError, ValueError):
                     usd_f = 0.0
                 try:
                     diem_f = float(diem)
-                except Exception:
+                except (TypeError, ValueError):
                     diem_f = 0.0
                 daily_usage.append(
                     DailyUsage(
@@ -475,29 +500,15 @@ async def get_daily_analytics(
                 source='billing/usage-analytics',
             )
 
-        usage_entries = []
-        page = 1
-        max_pages = settings.API_MAX_PAGES
-        while page <= max_pages:
-            params = {
-                'startDate': start_date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
-                'endDate': end_date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
-                'limit': settings.API_PAGE_SIZE,
-                'sortOrder': 'asc',
-                'page': page,
-            }
-            response = await client.get('/billing/usage', params=params)
-            if response.status_code >= 400:
-                response.raise_for_status()
-            data = response.json()
-            page_entries = data.get('data', [])
-            usage_entries.extend(page_entries)
-            pagination = data.get('pagination', {})
-            total_pages = int(pagination.get('totalPages', response.headers.get('x-pagination-total-pages', 1)))
-            if page >= total_pages:
-                break
-            page += 1
-        logger.info(f"Analytics /daily fetched {len(usage_entries)} billing entries across {page} page(s)")
+        usage_entries = await paginate_billing_usage(
+            client,
+            start_date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            end_date.strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+            sort_order='asc',
+        )
+        logger.info(
+            "Analytics /daily fetched %s billing entries for last %s day(s)", len(usage_entries), days
+        )
         
         daily_data: Dict[str, Dict] = {}
         request_tracker: Dict[str, set] = {}
@@ -507,18 +518,19 @@ async def get_daily_analytics(
             if not timestamp:
                 continue
             
-            try:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                date_key = dt.strftime('%Y-%m-%d')
-            except ValueError:
+            date_key = _iso_date_key(timestamp)
+            if date_key is None:
                 continue
             
             amount = abs(entry.get('amount', 0))
             currency = (entry.get('currency') or '').upper()
-            inference = entry.get('inferenceDetails') or {}
+            inference = entry.get('inferenceDetails')
+            if not isinstance(inference, dict):
+                inference = {}
             
-            if date_key not in daily_data:
-                daily_data[date_key] = {
+            day = daily_data.get(date_key)
+            if day is None:
+                day = daily_data[date_key] = {
                     'requests': 0,
                     'tokens': 0,
                     'cost': 0.0,
@@ -527,28 +539,24 @@ async def get_daily_analytics(
                 }
                 request_tracker[date_key] = set()
             
-            request_id = None
-            if isinstance(inference, dict):
-                request_id = inference.get('requestId')
-            
-            date_request_key = f"{date_key}-{request_id}" if request_id else None
-            if date_request_key and date_request_key not in request_tracker[date_key]:
-                request_tracker[date_key].add(date_request_key)
-                daily_data[date_key]['requests'] += 1
-            elif not request_id:
-                daily_data[date_key]['requests'] += 1
+            # Request ids are already bucketed per day, so track them directly.
+            request_id = inference.get('requestId')
+            if request_id:
+                seen = request_tracker[date_key]
+                if request_id not in seen:
+                    seen.add(request_id)
+                    day['requests'] += 1
+            else:
+                day['requests'] += 1
             
-            if isinstance(inference, dict):
-                prompt_tokens = inference.get('promptTokens') or 0
-                completion_tokens = inference.get('completionTokens') or 0
-                daily_data[date_key]['tokens'] += prompt_tokens + completion_tokens
+            day['tokens'] += (inference.get('promptTokens') or 0) + (inference.get('completionTokens') or 0)
             
             # BUG-05: separate by currency; do not sum every numeric field.
-            daily_data[date_key]['cost'] += amount
+            day['cost'] += amount
             if currency == 'USD':
-                daily_data[date_key]['cost_usd'] += amount
+                day['cost_usd'] += amount
             elif currency == 'DIEM':
-                daily_data[date_key]['cost_diem'] += amount
+                day['cost_diem'] += amount
         
         daily_usage = [
             DailyUsage(
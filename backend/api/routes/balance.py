@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,18 +23,20 @@ async def get_balance(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        # Prefer /billing/balance for accurate currency/epoch allocation info.
-        billing_payload = await client.get_json("/billing/balance")
+        # Prefer /billing/balance for accurate currency/epoch allocation info,
+        # with the rate-limits endpoint as fallback and for nextEpochBegins.
+        # The two calls are independent, so issue them concurrently.
+        tracker = UsageTracker(client.api_key, client)
+        billing_payload, balance_info = await asyncio.gather(
+            client.get_json("/billing/balance"),
+            tracker.fetch_rate_limits(),
+        )
         billing = billing_payload.get("data", {})
         balances = billing.get("balances", {})
         consumption_currency = billing.get("consumptionCurrency", "DIEM")
         can_consume = billing.get("canConsume", True)
         diem_epoch_allocation = billing.get("diemEpochAllocation")
 
-        # Fallback to rate-limits endpoint for nextEpochBegins.
-        tracker = UsageTracker(client.api_key, client)
-        balance_info = await tracker.fetch_rate_limits()
-
         diem_balance = float(balances.get("DIEM", balance_info.diem))
         usd_balance = float(balances.get("USD", balance_info.usd))
 
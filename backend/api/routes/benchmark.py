@@ -21,10 +21,12 @@ import sys
 import time
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import httpx
+import orjson
 from backend.core.venice_api_client import VeniceAPIClient
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import ValidationError
@@ -68,12 +70,22 @@ _ALWAYS_REASONING_MODELS = {
 }
 
 
+# Result files can run to several MB; read them in large chunks, not line-sized ones.
+_RESULT_READ_BUFFER = 64 * 1024
+
+
+def _read_result_file(path: Path) -> dict:
+    """Read and decode a benchmark result JSON file in a single buffered binary read."""
+    with open(path, "rb", buffering=_RESULT_READ_BUFFER) as fh:
+        return orjson.loads(fh.read())
+
+
 def _load_historical_completion_estimates(results_dir: Path) -> dict[str, dict[str, float]]:
     """Load observed completion token means per (model_id, test_id) from prior runs."""
     estimates: dict[str, dict[str, float]] = {}
     for path in sorted(results_dir.glob("benchmark_*.json"), key=lambda p: p.stat().st_mtime):
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = _read_result_file(path)
         except Exception:
             continue
         for model in data.get("models", []):
@@ -259,7 +271,7 @@ def _is_e2ee_or_tee(model: dict) -> bool:
 
 async def _fetch_and_filter_text_models(api_key: str) -> list[dict]:
     client = VeniceAPIClient(api_key)
-    data = await client.get_json("/models", params={"type": "text"})
+    data = await client.get_json("/models", params={"type": "text"}, cache_etag=True)
     raw = data.get("data", [])
     result = []
     for m in raw:
@@ -382,7 +394,10 @@ async def _resolve_models_and_estimate(
         raise HTTPException(400, "No models match the selected privacy filter")
 
     models = sorted(models, key=lambda m: m.get("id", ""))
-    calls, usd, skipped, warnings = _estimate_cost(models, tests, params.iterations, _results_dir())
+    # _estimate_cost reads every prior result file for historical token means.
+    calls, usd, skipped, warnings = await asyncio.to_thread(
+        _estimate_cost, models, tests, params.iterations, _results_dir()
+    )
     return models, tests, privacy, calls, usd, skipped, warnings
 
 
@@ -390,10 +405,18 @@ async def _resolve_models_and_estimate(
 # Routes
 # ---------------------------------------------------------------------------
 
-@router.get("/benchmark/runs")
-async def list_runs():
-    """List all benchmark result files, newest first."""
-    results_dir = _results_dir()
+@lru_cache(maxsize=256)
+def _format_run_timestamp(generated_at: str) -> str:
+    """Format a run's ISO generated_at for display; unparseable values pass through."""
+    try:
+        dt = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
+    except ValueError:
+        return generated_at
+    return dt.strftime("%Y-%m-%d %H:%M UTC")
+
+
+def _list_run_summaries(results_dir: Path) -> list[dict]:
+    """Summarise every result file in results_dir, newest first (blocking I/O)."""
     files = sorted(
         results_dir.glob("benchmark_*.json"),
         key=lambda f: f.stat().st_mtime,
@@ -403,8 +426,7 @@ async def list_runs():
     runs = []
     for f in files:
         try:
-            with f.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
+            data = _read_result_file(f)
         except Exception as exc:
             logger.warning("Could not parse %s: %s", f.name, exc)
             continue
@@ -412,11 +434,9 @@ async def list_runs():
         generated_at = data.get("generated_at", "")
         model_count = data.get("model_count", 0)
 
-        try:
-            dt = datetime.fromisoformat(generated_at.replace("Z", "+00:00"))
-            timestamp = dt.strftime("%Y-%m-%d %H:%M UTC")
-        except Exception:
-            timestamp = generated_at
+        timestamp = (
+            _format_run_timestamp(generated_at) if isinstance(generated_at, str) else generated_at
+        )
 
         runs.append({
             "run_id": f.stem,
@@ -426,6 +446,14 @@ async def list_runs():
             "timestamp": timestamp,
         })
 
+    return runs
+
+
+@router.get("/benchmark/runs")
+async def list_runs():
+    """List all benchmark result files, newest first."""
+    # Reading every result file is blocking disk I/O; keep it off the event loop.
+    runs = await asyncio.to_thread(_list_run_summaries, _results_dir())
     return {"runs": runs}
 
 
@@ -438,8 +466,7 @@ async def get_run(run_id: str):
     if not target.exists():
         raise HTTPException(404, f"Run '{run_id}' not found")
     try:
-        with target.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = await asyncio.to_thread(_read_result_file, target)
         # Inject run_id (the filename stem) so the frontend can reference it
         data["run_id"] = safe_id
         return data
@@ -818,8 +845,21 @@ def _build_infographic_prompt(models: list[dict]) -> str:
     )
 
 
+# Trait → model mappings change rarely; remember the resolved image model per key.
+_IMAGE_MODEL_TTL_SECONDS = 24 * 3600
+_image_model_cache: dict[str, tuple[float, str]] = {}
+
+
 async def _resolve_image_model(api_key: str) -> str:
-    """Discover a current image model via /models/traits; fall back to flux-2-pro."""
+    """Discover a current image model via /models/traits; fall back to flux-2-pro.
+
+    A discovered model is cached for _IMAGE_MODEL_TTL_SECONDS; the fallback is not,
+    so a transient traits failure does not pin flux-2-pro for a day.
+    """
+    cached = _image_model_cache.get(api_key)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
     client = VeniceAPIClient(api_key)
     try:
         traits = await client.get_json("/models/traits")
@@ -827,12 +867,11 @@ async def _resolve_image_model(api_key: str) -> str:
         mapping = traits.get("data", traits) if isinstance(traits, dict) else {}
         for key in ("image:fast", "image:default", "image"):
             model_id = mapping.get(key)
+            if isinstance(model_id, dict):
+                model_id = model_id.get("id") or model_id.get("model")
             if isinstance(model_id, str) and model_id:
+                _image_model_cache[api_key] = (time.monotonic() + _IMAGE_MODEL_TTL_SECONDS, model_id)
                 return model_id
-            if isinstance(model_id, dict):
-                mid = model_id.get("id") or model_id.get("model")
-                if mid:
-                    return mid
     except Exception as exc:
         logger.warning("Could not resolve image model from traits: %s", exc)
     return "flux-2-pro"
@@ -872,8 +911,7 @@ async def generate_infographic(run_id: str, request: Request):
         raise HTTPException(404, f"Run '{run_id}' not found")
 
     try:
-        with target.open("r", encoding="utf-8") as fh:
-            run_data = json.load(fh)
+        run_data = await asyncio.to_thread(_read_result_file, target)
     except Exception as exc:
         raise HTTPException(500, f"Failed to load run data: {exc}") from exc
 
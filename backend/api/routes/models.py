@@ -2,7 +2,7 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException
 from backend.config import get_settings, Settings
 from backend.core.venice_api_client import VeniceAPIClient
-from backend.core.model_cache import ModelCacheManager
+from backend.core.model_cache import get_model_cache_manager
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -15,11 +15,9 @@ def get_venice_client(settings: Settings = Depends(get_settings)) -> VeniceAPICl
 
 
 @router.get("/models")
-async def get_models(
-    client: VeniceAPIClient = Depends(get_venice_client)
-):
+async def get_models():
     try:
-        cache = ModelCacheManager(client)
+        cache = get_model_cache_manager()
         await cache.fetch_models()
 
         # Prefer full Venice model objects so the UI can render type-specific
@@ -63,12 +61,9 @@ async def get_model_traits(
 
 
 @router.get("/models/{model_id}")
-async def get_model(
-    model_id: str,
-    client: VeniceAPIClient = Depends(get_venice_client)
-):
+async def get_model(model_id: str):
     try:
-        cache = ModelCacheManager(client)
+        cache = get_model_cache_manager()
         await cache.fetch_models()
         model = cache.get_model(model_id)
 
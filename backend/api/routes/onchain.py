@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import time
@@ -113,6 +114,16 @@ async def _erc20_balance(client: VeniceAPIClient, token: str, holder: str) -> in
     return _decode_uint(await _eth_call(client, token, data))
 
 
+async def _read_supply_and_staked(client: VeniceAPIClient) -> Tuple[int, int, int]:
+    """Decimals, total supply and staking-contract balance, read concurrently."""
+    decimals, total_raw, staked_raw = await asyncio.gather(
+        _erc20_decimals(client, VVV_TOKEN),
+        _erc20_total_supply(client, VVV_TOKEN),
+        _erc20_balance(client, VVV_TOKEN, STAKING_CONTRACT),
+    )
+    return decimals, total_raw, staked_raw
+
+
 @router.get("/onchain/supply")
 async def get_onchain_supply(
     client: VeniceAPIClient = Depends(get_venice_client),
@@ -123,10 +134,8 @@ async def get_onchain_supply(
         return cached
 
     try:
-        decimals = await _erc20_decimals(client, VVV_TOKEN)
-        total_raw = await _erc20_total_supply(client, VVV_TOKEN)
         # Staking contract VVV balance ≈ staked amount (tokens locked in contract).
-        staked_raw = await _erc20_balance(client, VVV_TOKEN, STAKING_CONTRACT)
+        decimals, total_raw, staked_raw = await _read_supply_and_staked(client)
 
         scale = 10 ** decimals
         total = total_raw / scale
@@ -163,9 +172,7 @@ async def get_onchain_staking(
         return cached
 
     try:
-        decimals = await _erc20_decimals(client, VVV_TOKEN)
-        total_raw = await _erc20_total_supply(client, VVV_TOKEN)
-        staked_raw = await _erc20_balance(client, VVV_TOKEN, STAKING_CONTRACT)
+        decimals, total_raw, staked_raw = await _read_supply_and_staked(client)
         scale = 10 ** decimals
         total = total_raw / scale
         staked = staked_raw / scale
@@ -207,8 +214,10 @@ async def get_onchain_balance(
         return cached
 
     try:
-        decimals = await _erc20_decimals(client, VVV_TOKEN)
-        bal_raw = await _erc20_balance(client, VVV_TOKEN, address)
+        decimals, bal_raw = await asyncio.gather(
+            _erc20_decimals(client, VVV_TOKEN),
+            _erc20_balance(client, VVV_TOKEN, address),
+        )
         # Staking contract may hold sVVV; for now report VVV ERC-20 balance only.
         scale = 10 ** decimals
         result = {
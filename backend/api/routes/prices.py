@@ -1,7 +1,11 @@
+import asyncio
 import logging
-from typing import Optional
+import re
+import time
+from typing import Any, Optional
 
 import httpx
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,6 +18,67 @@ from backend.services import alert_engine
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_coingecko_client: Optional[httpx.AsyncClient] = None
+
+# The web UI polls /prices every 60s, well past httpx's default 5s keep-alive
+# expiry; keep idle connections long enough to be reused by the next poll.
+_COINGECKO_KEEPALIVE_SECONDS = 90.0
+
+
+def get_coingecko_client() -> httpx.AsyncClient:
+    """Return the shared CoinGecko httpx.AsyncClient, creating it on first use.
+
+    Reusing one client keeps the TLS connection to CoinGecko alive between
+    price polls instead of handshaking on every fetch.
+    """
+    global _coingecko_client
+    if _coingecko_client is None or _coingecko_client.is_closed:
+        _coingecko_client = httpx.AsyncClient(
+            timeout=30.0,
+            # Limits live on the transport because a custom transport is passed.
+            # retries covers connection failures only, not HTTP error statuses.
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=4,
+                    max_keepalive_connections=2,
+                    keepalive_expiry=_COINGECKO_KEEPALIVE_SECONDS,
+                ),
+                retries=2,
+            ),
+        )
+    return _coingecko_client
+
+
+async def close_coingecko_client() -> None:
+    """Close the shared CoinGecko client (called from the app lifespan on shutdown)."""
+    global _coingecko_client
+    if _coingecko_client is not None:
+        await _coingecko_client.aclose()
+        _coingecko_client = None
+
+
+# CoinGecko's simple/price data refreshes about once a minute. Answers are reused
+# for a short TTL, then revalidated with If-None-Match so an unchanged price
+# comes back as a body-less 304.
+_PRICE_TTL_SECONDS = 30.0
+_price_cache: dict[tuple[str, str, str], tuple[float, Optional[str], Any]] = {}
+
+
+_NUMBER_RE = re.compile(r"^\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*$")
+
+
+def _to_float(value) -> Optional[float]:
+    """Coerce a CoinGecko price value to float, or None if it is not numeric.
+
+    CoinGecko returns JSON numbers, so the isinstance check is the common path;
+    strings are pre-checked with a regex instead of relying on float() raising.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str) and _NUMBER_RE.match(value):
+        return float(value)
+    return None
+
 
 async def fetch_coin_gecko_price(
     token_id: str,
@@ -38,10 +103,22 @@ async def fetch_coin_gecko_price(
 
     url = f"{base_url}/simple/price"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    cache_key = (url, token_id, params["vs_currencies"])
+    cached = _price_cache.get(cache_key)
+    now = time.monotonic()
+    if cached and now < cached[0]:
+        return cached[2]
+    if cached and cached[1]:
+        headers["If-None-Match"] = cached[1]
+
+    response = await get_coingecko_client().get(url, params=params, headers=headers)
+    if response.status_code == 304 and cached:
+        _price_cache[cache_key] = (now + _PRICE_TTL_SECONDS, cached[1], cached[2])
+        return cached[2]
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    _price_cache[cache_key] = (now + _PRICE_TTL_SECONDS, response.headers.get("etag"), data)
+    return data
 
 
 @router.get("/prices")
@@ -50,16 +127,18 @@ async def get_prices(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        vvv_data = await fetch_coin_gecko_price(
-            settings.COINGECKO_TOKEN_ID,
-            settings.coingecko_currencies_list,
-            settings.COINGECKO_API_KEY
-        )
-
-        diem_data = await fetch_coin_gecko_price(
-            settings.DIEM_TOKEN_ID,
-            settings.coingecko_currencies_list,
-            settings.COINGECKO_API_KEY
+        # Independent lookups: fetch both tokens concurrently.
+        vvv_data, diem_data = await asyncio.gather(
+            fetch_coin_gecko_price(
+                settings.COINGECKO_TOKEN_ID,
+                settings.coingecko_currencies_list,
+                settings.COINGECKO_API_KEY
+            ),
+            fetch_coin_gecko_price(
+                settings.DIEM_TOKEN_ID,
+                settings.coingecko_currencies_list,
+                settings.COINGECKO_API_KEY
+            ),
         )
 
         result = {
@@ -112,18 +191,12 @@ async def get_prices(
         # BUG-07: only include metrics that have real present values.
         # Do not feed 0.0 for missing tokens/currencies (would spuriously fire lte alerts).
         price_alert_metrics: dict[str, float] = {}
-        vvv_usd = result["vvv"].get("usd")
+        vvv_usd = _to_float(result["vvv"].get("usd"))
         if vvv_usd is not None:
-            try:
-                price_alert_metrics["vvv_price_usd"] = float(vvv_usd)
-            except Exception:
-                pass
-        diem_usd = result["diem"].get("usd")
+            price_alert_metrics["vvv_price_usd"] = vvv_usd
+        diem_usd = _to_float(result["diem"].get("usd"))
         if diem_usd is not None:
-            try:
-                price_alert_metrics["diem_price_usd"] = float(diem_usd)
-            except Exception:
-                pass
+            price_alert_metrics["diem_price_usd"] = diem_usd
 
         if price_alert_metrics:
             try:
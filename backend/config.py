@@ -19,6 +19,10 @@ class Settings(BaseSettings):
     
     API_PAGE_SIZE: int = 500
     API_MAX_PAGES: int = 20
+    # Pages after the first are fetched concurrently, at most this many at once.
+    API_PAGE_CONCURRENCY: int = 4
+    # Multiplex Venice calls over one HTTP/2 connection; needs the optional h2 package.
+    VENICE_HTTP2: bool = False
     
     DEFAULT_DAILY_DIEM_LIMIT: float = 100.0
     DEFAULT_DAILY_USD_LIMIT: float = 25.0
@@ -67,8 +71,8 @@ class Settings(BaseSettings):
     # (if enabled) and/or request-path snapshots use this cadence.
     SNAPSHOT_INTERVAL_SECONDS: int = 300  # 5 minutes
 
-    # Retention for snapshot tables (days). Rows older than this are purged on
-    # each snapshot write and at startup.
+    # Retention for snapshot tables (days). Rows older than this are purged
+    # from the snapshot write path, at most once an hour per table.
     SNAPSHOT_RETENTION_DAYS: int = 90
     
     model_config = SettingsConfigDict(
@@ -1,10 +1,10 @@
 from backend.core.venice_api_client import VeniceAPIClient, mask_api_key
-from backend.core.usage_tracker import UsageWorker, APIKeyUsage, BalanceInfo, UsageMetrics
+from backend.core.usage_tracker import UsageTracker, APIKeyUsage, BalanceInfo, UsageMetrics
 
 __all__ = [
     "VeniceAPIClient",
     "mask_api_key",
-    "UsageWorker",
+    "UsageTracker",
     "APIKeyUsage",
     "BalanceInfo",
     "UsageMetrics",
@@ -5,14 +5,17 @@ Fetches and manages model data from the Venice API, providing dynamic model list
 and pricing information. Includes caching and fallback mechanisms for reliability.
 """
 
-import json
 import logging
 import os
+import threading
+import time
 from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime
 
+import orjson
+
 from backend.core.venice_api_client import VeniceAPIClient
 from backend.config import get_settings
 
@@ -24,7 +27,7 @@ logger = logging.getLogger(__name__)
 SENSITIVE_FILE_MODE = 0o600
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedModel:
     """Simplified model representation for caching"""
     id: str
@@ -77,18 +80,14 @@ class ModelCacheManager:
         self.models: Dict[str, CachedModel] = {}
         self.raw_api_data: Optional[Dict] = None  # Store raw API response for full details
         self.cache_timestamp: Optional[str] = None  # ISO format timestamp
+        self.cache_epoch: Optional[float] = None  # same instant as epoch seconds, for freshness checks
         self._load_cache()
 
     def _is_cache_fresh(self) -> bool:
         """Return True if in-memory/file cache is within CACHE_TTL_SECONDS."""
-        if not self.cache_timestamp or not self.models:
-            return False
-        try:
-            ts = datetime.fromisoformat(self.cache_timestamp)
-            age = (datetime.now() - ts).total_seconds()
-            return age < settings.CACHE_TTL_SECONDS
-        except (TypeError, ValueError):
+        if self.cache_epoch is None or not self.models:
             return False
+        return time.time() - self.cache_epoch < settings.CACHE_TTL_SECONDS
     
     async def fetch_models(self, force_refresh: bool = False) -> bool:
         """
@@ -112,18 +111,18 @@ class ModelCacheManager:
             response = await self.api_client.get("/models", params={"type": "all"})
             
             if response.status_code != 200:
-                logger.warning(f"Failed to fetch models: {response.status_code}")
+                logger.warning("Failed to fetch models: %s", response.status_code)
                 return False
             
-            data = response.json()
+            data = orjson.loads(response.content)
             self.raw_api_data = data  # Store raw data for accessing full model specs
             self._parse_models(data)
             self._save_cache()
-            logger.info(f"Successfully fetched and cached {len(self.models)} models")
+            logger.info("Successfully fetched and cached %d models", len(self.models))
             return True
             
         except Exception as e:
-            logger.warning(f"Failed to fetch models from API: {e}. Using cached data.")
+            logger.warning("Failed to fetch models from API: %s. Using cached data.", e)
             return False
     
     def _parse_models(self, api_response: Dict) -> None:
@@ -209,10 +208,10 @@ class ModelCacheManager:
                 )
                 
                 self.models[model_id] = cached_model
-                logger.debug(f"Cached model: {model_id} ({model_type})")
+                logger.debug("Cached model: %s (%s)", model_id, model_type)
                 
             except Exception as e:
-                logger.warning(f"Failed to parse model {model_data.get('id', 'unknown')}: {e}")
+                logger.warning("Failed to parse model %s: %s", model_data.get('id', 'unknown'), e)
                 continue
     
     def _save_cache(self) -> None:
@@ -220,10 +219,13 @@ class ModelCacheManager:
         try:
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
             
-            self.cache_timestamp = datetime.now().isoformat()
+            now = datetime.now()
+            self.cache_timestamp = now.isoformat()
+            self.cache_epoch = now.timestamp()
             
             cache_data = {
                 'timestamp': self.cache_timestamp,
+                'timestamp_epoch': self.cache_epoch,
                 'models': {
                     model_id: {
                         'id': m.id,
@@ -246,33 +248,50 @@ class ModelCacheManager:
                 'raw_api_data': self.raw_api_data
             }
             
-            # Write with secure permissions
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
-            
-            # Set restrictive file permissions (owner read/write only)
+            # Write to a temp file and rename over the cache, so a crash
+            # mid-write never leaves a truncated model_cache.json behind.
+            tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
             try:
-                os.chmod(self.cache_file, SENSITIVE_FILE_MODE)
-            except OSError as e:
-                logger.warning(f"Could not set file permissions on cache: {e}")
+                with open(tmp_file, 'wb') as f:
+                    f.write(orjson.dumps(cache_data, option=orjson.OPT_INDENT_2))
+                    f.flush()
+                    os.fsync(f.fileno())
+                
+                # Set restrictive file permissions (owner read/write only)
+                try:
+                    os.chmod(tmp_file, SENSITIVE_FILE_MODE)
+                except OSError as e:
+                    logger.warning("Could not set file permissions on cache: %s", e)
+                
+                os.replace(tmp_file, self.cache_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
             
-            logger.debug(f"Saved model cache to {self.cache_file} (timestamp: {self.cache_timestamp})")
+            logger.debug("Saved model cache to %s (timestamp: %s)", self.cache_file, self.cache_timestamp)
             
         except Exception as e:
-            logger.warning(f"Failed to save model cache: {e}")
+            logger.warning("Failed to save model cache: %s", e)
     
     def _load_cache(self) -> None:
         """Load models from local cache file if it exists."""
         try:
             if not self.cache_file.exists():
-                logger.debug(f"No cache file found at {self.cache_file}")
+                logger.debug("No cache file found at %s", self.cache_file)
                 return
             
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            with open(self.cache_file, 'rb') as f:
+                cache_data = orjson.loads(f.read())
             
             # Load timestamp if present
             self.cache_timestamp = cache_data.get('timestamp')
+            self.cache_epoch = cache_data.get('timestamp_epoch')
+            if self.cache_epoch is None and self.cache_timestamp:
+                # Cache files written before timestamp_epoch existed: parse once here.
+                try:
+                    self.cache_epoch = datetime.fromisoformat(self.cache_timestamp).timestamp()
+                except (TypeError, ValueError):
+                    self.cache_epoch = None
             
             models_data = cache_data.get('models', {})
             for model_id, model_dict in models_data.items():
@@ -295,10 +314,10 @@ class ModelCacheManager:
             
             self.raw_api_data = cache_data.get('raw_api_data')
             timestamp_str = f" (updated: {self.cache_timestamp})" if self.cache_timestamp else ""
-            logger.info(f"Loaded {len(self.models)} models from cache{timestamp_str}")
+            logger.info("Loaded %d models from cache%s", len(self.models), timestamp_str)
             
         except Exception as e:
-            logger.warning(f"Failed to load model cache: {e}")
+            logger.warning("Failed to load model cache: %s", e)
     
     def get_model(self, model_id: str) -> Optional[CachedModel]:
         """Get a specific model by ID."""
@@ -584,6 +603,26 @@ class ModelCacheManager:
         try:
             dt = datetime.fromisoformat(self.cache_timestamp)
             return dt.strftime(format_str)
-        except Exception as e:
-            logger.warning(f"Failed to format cache timestamp: {e}")
+        except (TypeError, ValueError) as e:
+            logger.warning("Failed to format cache timestamp: %s", e)
             return None
+
+
+_model_cache_manager: Optional[ModelCacheManager] = None
+_model_cache_manager_lock = threading.Lock()
+
+
+def get_model_cache_manager() -> ModelCacheManager:
+    """Return the process-wide ModelCacheManager, loading model_cache.json on first use.
+
+    Sharing one manager keeps the parsed cache in memory between requests instead
+    of re-reading the file from disk for every /models call. Creation is
+    double-checked under a lock so worker threads (asyncio.to_thread callers)
+    cannot race and build two managers.
+    """
+    global _model_cache_manager
+    if _model_cache_manager is None:
+        with _model_cache_manager_lock:
+            if _model_cache_manager is None:
+                _model_cache_manager = ModelCacheManager()
+    return _model_cache_manager
@@ -5,26 +5,47 @@ Web-optimized version without Qt dependencies.
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import logging
+import time
 from datetime import datetime, timezone, timedelta
 
+import orjson
+
 from backend.core.venice_api_client import VeniceAPIClient
 from backend.config import get_settings
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# The key list changes rarely and is polled by several dashboard views, so it is
+# cached in-process per API key: api_key -> (expires_at, keys). The TTL grows
+# with how long Venice took to answer: a slow upstream makes a hit worth more.
+_KEYS_CACHE_MIN_TTL = 30.0
+_KEYS_CACHE_MAX_TTL = 120.0
+_KEYS_CACHE_TTL_PER_SECOND = 20.0  # extra TTL per second of upstream latency
+
+
+def _keys_cache_ttl(elapsed: float) -> float:
+    return max(_KEYS_CACHE_MIN_TTL, min(_KEYS_CACHE_MAX_TTL, elapsed * _KEYS_CACHE_TTL_PER_SECOND))
 
-@dataclass
+_keys_cache: Dict[str, Tuple[float, List["APIKeyUsage"]]] = {}
+# Last /api_keys ETag per admin key with the list built from that body; a 304 reuses the list.
+_keys_etags: Dict[str, Tuple[str, List["APIKeyUsage"]]] = {}
+# In-flight /api_keys fetches per admin key, so a cold-cache burst makes one upstream call.
+_keys_inflight: Dict[str, "asyncio.Future[List[APIKeyUsage]]"] = {}
+
+
+@dataclass(slots=True)
 class UsageMetrics:
     """Tracks usage metrics for a specific time period"""
     diem: float
     usd: float
 
 
-@dataclass
+@dataclass(slots=True)
 class APIKeyUsage:
     """Represents usage data for a single API key"""
     id: str
@@ -34,8 +55,26 @@ class APIKeyUsage:
     is_active: bool
     last_used_at: Optional[str] = None
 
-
-@dataclass
+    @classmethod
+    def from_dict(cls, key_data: Dict[str, Any]) -> "APIKeyUsage":
+        """Build from one entry of the /api_keys response."""
+        get = key_data.get
+        key_id = get("id", "unknown")
+        usage_data = (get("usage") or {}).get("trailingSevenDays") or {}
+        return cls(
+            id=key_id,
+            name=get("description", f"Key {key_id[-8:]}"),
+            usage=UsageMetrics(
+                diem=float(usage_data.get("diem", 0)),
+                usd=float(usage_data.get("usd", 0)),
+            ),
+            created_at=get("createdAt", "2025-01-01T00:00:00Z"),
+            is_active=get("isActive", True),
+            last_used_at=get("lastUsedAt"),
+        )
+
+
+@dataclass(slots=True)
 class BalanceInfo:
     """Tracks current balance information and daily limits"""
     diem: float
@@ -61,6 +100,66 @@ def _net_usage_from_entries(entries: List[Dict[str, Any]]) -> Dict[str, float]:
     return totals
 
 
+async def paginate_billing_usage(
+    api_client: VeniceAPIClient,
+    start_datetime: str,
+    end_datetime: str,
+    sort_order: str = "desc",
+) -> List[Dict[str, Any]]:
+    """Paginate /billing/usage with API_MAX_PAGES safety cap.
+
+    Page 1 reports the total page count; the remaining pages are then fetched
+    concurrently (bounded by API_PAGE_CONCURRENCY) and concatenated in page order.
+    """
+
+    async def fetch_page(page: int) -> Tuple[List[Dict[str, Any]], int]:
+        params = {
+            "startDate": start_datetime,
+            "endDate": end_datetime,
+            "limit": settings.API_PAGE_SIZE,
+            "sortOrder": sort_order,
+            "page": page,
+        }
+        response = await api_client.get("/billing/usage", params=params)
+        if response.status_code >= 400:
+            response.raise_for_status()
+        payload = orjson.loads(response.content)
+        pagination = payload.get("pagination", {})
+        total_pages = int(
+            pagination.get(
+                "totalPages",
+                response.headers.get("x-pagination-total-pages", 1),
+            )
+        )
+        return payload.get("data", []), total_pages
+
+    first_entries, total_pages = await fetch_page(1)
+    entries: List[Dict[str, Any]] = list(first_entries)
+    max_pages = settings.API_MAX_PAGES
+
+    if total_pages > max_pages:
+        logger.warning(
+            "billing/usage pagination hit API_MAX_PAGES=%s (%s → %s); totals may be incomplete",
+            max_pages,
+            start_datetime,
+            end_datetime,
+        )
+
+    last_page = min(total_pages, max_pages)
+    if last_page > 1:
+        semaphore = asyncio.Semaphore(max(1, settings.API_PAGE_CONCURRENCY))
+
+        async def bounded(page: int) -> Tuple[List[Dict[str, Any]], int]:
+            async with semaphore:
+                return await fetch_page(page)
+
+        pages = await asyncio.gather(*(bounded(p) for p in range(2, last_page + 1)))
+        for page_entries, _ in pages:
+            entries.extend(page_entries)
+
+    return entries
+
+
 class UsageTracker:
     """
     Service class for fetching Venice API usage data.
@@ -94,45 +193,9 @@ class UsageTracker:
         end_datetime: str,
         sort_order: str = "desc",
     ) -> List[Dict[str, Any]]:
-        """Paginate /billing/usage with API_MAX_PAGES safety cap."""
-        entries: List[Dict[str, Any]] = []
-        page = 1
-        max_pages = settings.API_MAX_PAGES
-
-        while page <= max_pages:
-            params = {
-                "startDate": start_datetime,
-                "endDate": end_datetime,
-                "limit": settings.API_PAGE_SIZE,
-                "sortOrder": sort_order,
-                "page": page,
-            }
-            response = await self.api_client.get("/billing/usage", params=params)
-            if response.status_code >= 400:
-                response.raise_for_status()
-            payload = response.json()
-            page_entries = payload.get("data", [])
-            entries.extend(page_entries)
-
-            pagination = payload.get("pagination", {})
-            total_pages = int(
-                pagination.get(
-                    "totalPages",
-                    response.headers.get("x-pagination-total-pages", 1),
-                )
-            )
-            if page >= total_pages:
-                break
-            page += 1
-        else:
-            logger.warning(
-                "billing/usage pagination hit API_MAX_PAGES=%s (%s → %s); totals may be incomplete",
-                max_pages,
-                start_datetime,
-                end_datetime,
-            )
-
-        return entries
+        return await paginate_billing_usage(
+            self.api_client, start_datetime, end_datetime, sort_order
+        )
 
     async def get_epoch_usage(self) -> Dict:
         """Query billing usage from the start of the current epoch to now.
@@ -190,49 +253,53 @@ class UsageTracker:
         except Exception as e:
             raise Exception(f"Failed to fetch daily usage: {e}") from e
 
-    async def fetch_api_keys_with_daily_usage(self) -> List[APIKeyUsage]:
-        try:
-            keys_data = await self.api_client.get_json("/api_keys")
-
-            api_keys: List[APIKeyUsage] = []
-            for key_data in keys_data.get("data", []):
-                key_id = key_data.get("id", "unknown")
-                usage_data = key_data.get("usage", {}).get("trailingSevenDays", {})
-                metrics = UsageMetrics(
-                    diem=float(usage_data.get("diem", 0)),
-                    usd=float(usage_data.get("usd", 0)),
-                )
-                api_keys.append(
-                    APIKeyUsage(
-                        id=key_id,
-                        name=key_data.get("description", f"Key {key_id[-8:]}"),
-                        usage=metrics,
-                        created_at=key_data.get("createdAt", "2025-01-01T00:00:00Z"),
-                        is_active=key_data.get("isActive", True),
-                        last_used_at=key_data.get("lastUsedAt"),
-                    )
-                )
-            return api_keys
-        except Exception as e:
-            raise Exception(f"Failed to fetch keys with daily usage: {e}") from e
+    async def fetch_api_keys_with_daily_usage(self, allow_stale: bool = True) -> List[APIKeyUsage]:
+        """Return per-key trailing usage, cached for an adaptive TTL (see _keys_cache_ttl).
 
+        Concurrent callers on a cold cache share a single upstream request.
+        If Venice is unreachable and allow_stale is set, the last successfully
+        fetched list is returned (even if expired) instead of raising.
+        """
+        cached = _keys_cache.get(self.admin_key)
+        if cached and time.monotonic() < cached[0]:
+            return list(cached[1])
 
-class UsageWorker:
-    """
-    Compatibility class that wraps UsageTracker.
-    Provides the same interface as the Qt-based UsageWorker.
-    """
+        inflight = _keys_inflight.get(self.admin_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._load_api_keys())
+            _keys_inflight[self.admin_key] = inflight
+            admin_key = self.admin_key
+            inflight.add_done_callback(lambda _: _keys_inflight.pop(admin_key, None))
 
-    def __init__(self, admin_key: str, parent=None):
-        self.admin_key = admin_key
-        self.api_client = VeniceAPIClient(admin_key)
-        self._tracker = UsageTracker(admin_key, self.api_client)
+        try:
+            # shield: one caller being cancelled must not cancel the shared fetch.
+            return list(await asyncio.shield(inflight))
+        except Exception as e:
+            if allow_stale and cached:
+                logger.warning("Serving stale API key list after fetch failure: %s", e)
+                return list(cached[1])
+            raise Exception(f"Failed to fetch keys with daily usage: {e}") from e
 
-    async def fetch_rate_limits(self) -> BalanceInfo:
-        return await self._tracker.fetch_rate_limits()
+    async def _load_api_keys(self) -> List[APIKeyUsage]:
+        """Fetch /api_keys, revalidating with If-None-Match when an ETag is known."""
+        known = _keys_etags.get(self.admin_key)
+        headers = {"If-None-Match": known[0]} if known else None
 
-    async def get_daily_usage(self, target_date: Optional[str] = None) -> Dict[str, float]:
-        return await self._tracker.get_daily_usage(target_date)
+        started = time.monotonic()
+        response = await self.api_client.get("/api_keys", headers=headers)
+        elapsed = time.monotonic() - started
 
-    async def fetch_api_keys_with_daily_usage(self) -> List[APIKeyUsage]:
-        return await self._tracker.fetch_api_keys_with_daily_usage()
+        if response.status_code == 304 and known:
+            api_keys = known[1]
+        else:
+            if response.status_code >= 400:
+                response.raise_for_status()
+            keys_data = orjson.loads(response.content)
+            api_keys = [APIKeyUsage.from_dict(k) for k in keys_data.get("data", ())]
+            etag = response.headers.get("etag")
+            if etag:
+                _keys_etags[self.admin_key] = (etag, api_keys)
+            else:
+                _keys_etags.pop(self.admin_key, None)
+        _keys_cache[self.admin_key] = (time.monotonic() + _keys_cache_ttl(elapsed), api_keys)
+        return api_keys
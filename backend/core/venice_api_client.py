@@ -2,18 +2,26 @@
 Venice API Client helper for shared API request functionality.
 
 Async httpx-based client with automatic retry on transient failures.
+All instances share one pooled httpx.AsyncClient so back-to-back calls to
+the Venice API reuse TCP/TLS connections instead of handshaking per call.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import importlib.util
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 import logging
 
 import httpx
+import orjson
 from tenacity import (
+    RetryCallState,
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
     retry_if_exception_type,
 )
 
@@ -22,6 +30,94 @@ from backend.config import get_settings
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+_http_client: Optional[httpx.AsyncClient] = None
+
+# (api_key, endpoint, params) -> (ETag, raw body) for conditional GETs in get_json.
+# Bodies are kept as bytes so every caller gets its own freshly parsed object.
+_ETAG_CACHE_MAX_ENTRIES = 256
+_etag_cache: Dict[Tuple[str, str, Tuple], Tuple[str, bytes]] = {}
+
+
+def _http2_enabled() -> bool:
+    """True when VENICE_HTTP2 is set and the optional h2 package is importable."""
+    if not settings.VENICE_HTTP2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("VENICE_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled httpx.AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            http2=_http2_enabled(),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled client (called from the app lifespan on shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# 429 is retried alongside 5xx; Retry-After waits are capped so a bad header cannot stall a request.
+_RETRYABLE_STATUS = 429
+_MAX_RETRY_AFTER_SECONDS = 30.0
+_backoff_with_jitter = wait_exponential_jitter(initial=1, max=10, jitter=1)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Honour the server's Retry-After when given, else jittered exponential backoff."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, httpx.HTTPStatusError):
+        retry_after = _retry_after_seconds(exc.response.headers.get("retry-after"))
+        if retry_after is not None:
+            return min(retry_after, _MAX_RETRY_AFTER_SECONDS)
+    return _backoff_with_jitter(retry_state)
+
+
+@lru_cache(maxsize=16)
+def _request_headers(api_key: str) -> httpx.Headers:
+    """Build (and normalise) the per-key request headers once.
+
+    Passing an httpx.Headers lets httpx copy the already-encoded header list on
+    each request instead of re-encoding a plain dict every call.
+    """
+    return httpx.Headers({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    })
+
+
+def _encode_body(data: Optional[Dict]) -> Optional[bytes]:
+    """Serialise a JSON request body with orjson (Content-Type is set on the client headers)."""
+    return orjson.dumps(data) if data is not None else None
+
 
 def mask_api_key(api_key: str, visible_chars: int = 4) -> str:
     """Mask API key for safe logging."""
@@ -36,25 +132,28 @@ class VeniceAPIClient:
     """
     Async Venice API client with shared configuration and retry logic.
 
-    Uses httpx.AsyncClient. Prefer get_json/post_json helpers which check
-    status codes before parsing.
+    Requests go through the shared pooled client from get_http_client().
+    Prefer get_json/post_json helpers which check status codes before parsing.
     """
 
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = settings.VENICE_API_BASE_URL
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        # Shared per key and treated as read-only; see _request_headers.
+        self.headers = _request_headers(api_key)
         logger.debug("VeniceAPIClient initialized with key: %s", mask_api_key(api_key))
 
     def _url(self, endpoint: str) -> str:
         return f"{self.base_url}{endpoint}"
 
+    def _with_headers(self, extra: Dict[str, str]) -> httpx.Headers:
+        merged = self.headers.copy()
+        merged.update(extra)
+        return merged
+
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_retry_wait,
         retry=retry_if_exception_type((
             httpx.ConnectError,
             httpx.TimeoutException,
@@ -73,21 +172,22 @@ class VeniceAPIClient:
         endpoint: str,
         params: Optional[Dict] = None,
         timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
     ) -> httpx.Response:
-        """GET with retry on transient failures. Retries 5xx only."""
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(
-                self._url(endpoint),
-                headers=self.headers,
-                params=params,
-            )
-            if response.status_code >= 500:
-                response.raise_for_status()
-            return response
+        """GET with retry on transient failures. Retries 429 and 5xx."""
+        response = await get_http_client().get(
+            self._url(endpoint),
+            headers=self._with_headers(headers) if headers else self.headers,
+            params=params,
+            timeout=timeout,
+        )
+        if response.status_code >= 500 or response.status_code == _RETRYABLE_STATUS:
+            response.raise_for_status()
+        return response
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_retry_wait,
         retry=retry_if_exception_type((
             httpx.ConnectError,
             httpx.TimeoutException,
@@ -107,20 +207,20 @@ class VeniceAPIClient:
         data: Optional[Dict] = None,
         timeout: float = 30.0,
     ) -> httpx.Response:
-        """POST with retry on transient failures. Retries 5xx only."""
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                self._url(endpoint),
-                headers=self.headers,
-                json=data,
-            )
-            if response.status_code >= 500:
-                response.raise_for_status()
-            return response
+        """POST with retry on transient failures. Retries 429 and 5xx."""
+        response = await get_http_client().post(
+            self._url(endpoint),
+            headers=self.headers,
+            content=_encode_body(data),
+            timeout=timeout,
+        )
+        if response.status_code >= 500 or response.status_code == _RETRYABLE_STATUS:
+            response.raise_for_status()
+        return response
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_retry_wait,
         retry=retry_if_exception_type((
             httpx.ConnectError,
             httpx.TimeoutException,
@@ -140,20 +240,20 @@ class VeniceAPIClient:
         data: Optional[Dict] = None,
         timeout: float = 30.0,
     ) -> httpx.Response:
-        """PUT with retry on transient failures. Retries 5xx only."""
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.put(
-                self._url(endpoint),
-                headers=self.headers,
-                json=data,
-            )
-            if response.status_code >= 500:
-                response.raise_for_status()
-            return response
+        """PUT with retry on transient failures. Retries 429 and 5xx."""
+        response = await get_http_client().put(
+            self._url(endpoint),
+            headers=self.headers,
+            content=_encode_body(data),
+            timeout=timeout,
+        )
+        if response.status_code >= 500 or response.status_code == _RETRYABLE_STATUS:
+            response.raise_for_status()
+        return response
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_retry_wait,
         retry=retry_if_exception_type((
             httpx.ConnectError,
             httpx.TimeoutException,
@@ -172,15 +272,15 @@ class VeniceAPIClient:
         endpoint: str,
         timeout: float = 30.0,
     ) -> httpx.Response:
-        """DELETE with retry on transient failures. Retries 5xx only."""
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.delete(
-                self._url(endpoint),
-                headers=self.headers,
-            )
-            if response.status_code >= 500:
-                response.raise_for_status()
-            return response
+        """DELETE with retry on transient failures. Retries 429 and 5xx."""
+        response = await get_http_client().delete(
+            self._url(endpoint),
+            headers=self.headers,
+            timeout=timeout,
+        )
+        if response.status_code >= 500 or response.status_code == _RETRYABLE_STATUS:
+            response.raise_for_status()
+        return response
 
     async def get_json(
         self,
@@ -188,12 +288,34 @@ class VeniceAPIClient:
         params: Optional[Dict] = None,
         timeout: float = 30.0,
         raise_for_status: bool = True,
+        cache_etag: Optional[bool] = None,
     ) -> Any:
-        """GET and return parsed JSON. Raises on non-2xx when raise_for_status=True."""
-        response = await self.get(endpoint, params=params, timeout=timeout)
+        """GET and return parsed JSON. Raises on non-2xx when raise_for_status=True.
+
+        Responses carrying an ETag are revalidated with If-None-Match on the next
+        call; a 304 reuses the cached body instead of transferring it again.
+        Only param-less requests are cached by default; pass cache_etag=True for
+        fixed params. Caller-supplied params (e.g. date ranges) rarely repeat and
+        would just evict useful entries.
+        """
+        if cache_etag is None:
+            cache_etag = not params
+        cache_key = (self.api_key, endpoint, tuple(sorted((params or {}).items())))
+        cached = _etag_cache.get(cache_key) if cache_etag else None
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = await self.get(endpoint, params=params, timeout=timeout, headers=headers)
+        if response.status_code == 304 and cached:
+            return orjson.loads(cached[1])
         if raise_for_status and response.status_code >= 400:
             response.raise_for_status()
-        return response.json()
+
+        etag = response.headers.get("etag")
+        if cache_etag and etag and response.status_code == 200:
+            if cache_key not in _etag_cache and len(_etag_cache) >= _ETAG_CACHE_MAX_ENTRIES:
+                _etag_cache.pop(next(iter(_etag_cache)))
+            _etag_cache[cache_key] = (etag, response.content)
+        return orjson.loads(response.content)
 
     async def post_json(
         self,
@@ -206,4 +328,4 @@ class VeniceAPIClient:
         response = await self.post(endpoint, data=data, timeout=timeout)
         if raise_for_status and response.status_code >= 400:
             response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
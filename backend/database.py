@@ -1,30 +1,61 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import declarative_base
 from backend.config import get_settings
 
-settings = get_settings()
+Base = declarative_base()
 
-engine = create_async_engine(
-    settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
-    echo=settings.SQL_ECHO,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10
-)
+# Built on first use rather than at import, so importing models or routes
+# (tests, scripts) does not read DATABASE_URL or load the asyncpg driver.
+_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker] = None
 
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False
-)
 
-Base = declarative_base()
+def get_engine() -> AsyncEngine:
+    """Return the process-wide async engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        settings = get_settings()
+        _engine = create_async_engine(
+            settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://"),
+            echo=settings.SQL_ECHO,
+            pool_pre_ping=True,
+            pool_size=5,
+            max_overflow=10
+        )
+    return _engine
+
+
+def get_session_factory() -> async_sessionmaker:
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False
+        )
+    return _session_factory
+
+
+async def dispose_engine() -> None:
+    """Dispose the engine if it was created (called from the app lifespan on shutdown)."""
+    global _engine, _session_factory
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _session_factory = None
 
 
 async def get_db() -> AsyncSession:
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
         finally:
@@ -44,7 +75,7 @@ async def init_db():
 
     logger = logging.getLogger(__name__)
     try:
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables ready")
     except Exception:
@@ -7,7 +7,9 @@ from fastapi.responses import JSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from backend.config import get_settings
-from backend.database import init_db, engine
+from backend.database import dispose_engine, init_db
+from backend.core.venice_api_client import close_http_client
+from backend.api.routes.prices import close_coingecko_client
 from backend.limiter import limiter
 from backend.api.routes import usage, balance, prices, models, health, analytics, benchmark, onchain, alerts
 from backend.api.deps import verify_auth
@@ -23,55 +25,80 @@ if not settings.APP_PASSWORD and not settings.ALLOW_INSECURE_NO_AUTH:
         "or set ALLOW_INSECURE_NO_AUTH=true to explicitly run without auth "
         "(NOT recommended for anything but a fully isolated, trusted network)."
     )
-if not settings.APP_PASSWORD and settings.ALLOW_INSECURE_NO_AUTH:
-    logging.getLogger(__name__).warning(
-        "SECURITY WARNING: running with ALLOW_INSECURE_NO_AUTH=true and no "
-        "APP_PASSWORD. All API endpoints are unauthenticated."
-    )
 
-# Ensure log directory exists
-os.makedirs(os.path.dirname(settings.LOG_FILE_PATH), exist_ok=True)
+logger = logging.getLogger(__name__)
+_logging_configured = False
 
-log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
-log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-# Console handler
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(logging.Formatter(log_format))
+def configure_logging() -> None:
+    """Attach console and file handlers; safe to call more than once.
 
-# File handler (persistent across restarts)
-file_handler = logging.FileHandler(settings.LOG_FILE_PATH)
-file_handler.setFormatter(logging.Formatter(log_format))
+    Kept out of module scope so importing ``backend.main`` (tests, tooling)
+    does not create the log directory or open the log file.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
 
-logging.basicConfig(
-    level=log_level,
-    handlers=[console_handler, file_handler]
-)
-logger = logging.getLogger(__name__)
+    # Ensure log directory exists
+    os.makedirs(os.path.dirname(settings.LOG_FILE_PATH), exist_ok=True)
 
-# Apply LOG_LEVEL to uvicorn loggers for consistent verbosity
-logging.getLogger("uvicorn").setLevel(log_level)
-logging.getLogger("uvicorn.access").setLevel(log_level)
-logging.getLogger("uvicorn.error").setLevel(log_level)
+    log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
+    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+    # Console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(log_format))
+
+    # File handler (persistent across restarts)
+    file_handler = logging.FileHandler(settings.LOG_FILE_PATH)
+    file_handler.setFormatter(logging.Formatter(log_format))
+
+    logging.basicConfig(
+        level=log_level,
+        handlers=[console_handler, file_handler]
+    )
+
+    # Apply LOG_LEVEL to uvicorn loggers for consistent verbosity
+    logging.getLogger("uvicorn").setLevel(log_level)
+    logging.getLogger("uvicorn.access").setLevel(log_level)
+    logging.getLogger("uvicorn.error").setLevel(log_level)
+    _logging_configured = True
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    configure_logging()
+    if not settings.APP_PASSWORD and settings.ALLOW_INSECURE_NO_AUTH:
+        logger.warning(
+            "SECURITY WARNING: running with ALLOW_INSECURE_NO_AUTH=true and no "
+            "APP_PASSWORD. All API endpoints are unauthenticated."
+        )
     logger.info("Starting VVV Token Watch API...")
     await init_db()
     logger.info("Database initialized")
     yield
     logger.info("Shutting down VVV Token Watch API...")
     try:
-        await engine.dispose()
+        await dispose_engine()
         logger.info("Database engine disposed")
     except Exception as e:
-        logger.error(f"Error disposing database engine: {e}")
+        logger.error("Error disposing database engine: %s", e)
+    try:
+        await close_http_client()
+        logger.info("Venice HTTP client closed")
+    except Exception as e:
+        logger.error("Error closing Venice HTTP client: %s", e)
+    try:
+        await close_coingecko_client()
+        logger.info("CoinGecko HTTP client closed")
+    except Exception as e:
+        logger.error("Error closing CoinGecko HTTP client: %s", e)
     try:
         from backend.api.routes.benchmark import terminate_all_jobs
         await terminate_all_jobs()
     except Exception as e:
-        logger.error(f"Error terminating benchmark jobs: {e}")
+        logger.error("Error terminating benchmark jobs: %s", e)
 
 
 app = FastAPI(
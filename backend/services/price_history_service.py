@@ -1,14 +1,20 @@
 """Persist and query price snapshots for historical charts.
 
 BUG-04: request-path writes now dedupe (skip identical consecutive values)
-and trigger retention purge based on SNAPSHOT_RETENTION_DAYS.
+and trigger retention purge based on SNAPSHOT_RETENTION_DAYS. The purge is a
+table-wide DELETE, so it runs at most once per _PURGE_INTERVAL_SECONDS rather
+than on every write. The last values written per token are remembered in
+memory, so the dedupe check only queries the table once per token per process.
+Request-path writes for a token are also limited to one per
+SNAPSHOT_INTERVAL_SECONDS, so frequent polling does not hit the table every time.
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +24,34 @@ from backend.models.db import PriceSnapshot
 
 logger = logging.getLogger(__name__)
 
+_PURGE_INTERVAL_SECONDS = 3600.0
+_last_purge_at: Optional[float] = None
+
+_PriceValues = Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]
+
+# token_id -> (price_usd, price_aud, market_cap, change_24h) of the newest row this process knows of.
+_last_values: Dict[str, _PriceValues] = {}
+
+# token_id -> monotonic time of the last inserted row, for SNAPSHOT_INTERVAL_SECONDS.
+_last_written_at: Dict[str, float] = {}
+
+
+def _within_snapshot_interval(token_id: str, interval_seconds: int) -> bool:
+    last = _last_written_at.get(token_id)
+    return last is not None and time.monotonic() - last < interval_seconds
+
+
+def _eq(a: Optional[float], b: Optional[float]) -> bool:
+    if a is None and b is None:
+        return True
+    if a is None or b is None:
+        return False
+    return abs(a - b) < 1e-9
+
+
+def _same_values(a: _PriceValues, b: _PriceValues) -> bool:
+    return all(_eq(x, y) for x, y in zip(a, b))
+
 
 async def _purge_old_price_snapshots(db: AsyncSession, retention_days: int) -> int:
     if retention_days <= 0:
@@ -32,6 +66,18 @@ async def _purge_old_price_snapshots(db: AsyncSession, retention_days: int) -> i
     return deleted
 
 
+async def _maybe_purge_old_price_snapshots(db: AsyncSession, retention_days: int) -> int:
+    """Run the retention purge if it has not run within _PURGE_INTERVAL_SECONDS."""
+    global _last_purge_at
+    now = time.monotonic()
+    if _last_purge_at is not None and now - _last_purge_at < _PURGE_INTERVAL_SECONDS:
+        return 0
+    # Only record the run once it succeeds, so a failed purge is retried next write.
+    deleted = await _purge_old_price_snapshots(db, retention_days)
+    _last_purge_at = now
+    return deleted
+
+
 async def record_price_snapshot(
     db: AsyncSession,
     *,
@@ -43,38 +89,35 @@ async def record_price_snapshot(
 ) -> Optional[PriceSnapshot]:
     """Record a price snapshot with dedupe + retention (BUG-04).
 
-    Returns the inserted row, or None if a duplicate (identical values) was skipped.
+    Returns the inserted row, or None if the write was skipped because it was
+    a duplicate (identical values) or inside SNAPSHOT_INTERVAL_SECONDS.
     """
     settings = get_settings()
 
+    if _within_snapshot_interval(token_id, settings.SNAPSHOT_INTERVAL_SECONDS):
+        return None
+
     # Dedupe: skip if the last row for this token has identical numeric values.
-    last_stmt = (
-        select(PriceSnapshot)
-        .where(PriceSnapshot.token_id == token_id)
-        .order_by(PriceSnapshot.timestamp.desc())
-        .limit(1)
-    )
-    last_res = await db.execute(last_stmt)
-    last = last_res.scalars().first()
-    if last is not None:
-        def _eq(a: Optional[float], b: Optional[float]) -> bool:
-            if a is None and b is None:
-                return True
-            if a is None or b is None:
-                return False
-            return abs(a - b) < 1e-9
-
-        if (
-            _eq(last.price_usd, price_usd)
-            and _eq(last.price_aud, price_aud)
-            and _eq(last.market_cap, market_cap)
-            and _eq(last.change_24h, change_24h)
-        ):
-            try:
-                await _purge_old_price_snapshots(db, settings.SNAPSHOT_RETENTION_DAYS)
-            except Exception:
-                logger.exception("Purge failed during deduped price snapshot")
-            return None
+    values = (price_usd, price_aud, market_cap, change_24h)
+    last_values = _last_values.get(token_id)
+    if last_values is None:
+        last_stmt = (
+            select(PriceSnapshot)
+            .where(PriceSnapshot.token_id == token_id)
+            .order_by(PriceSnapshot.timestamp.desc())
+            .limit(1)
+        )
+        last_res = await db.execute(last_stmt)
+        last = last_res.scalars().first()
+        if last is not None:
+            last_values = (last.price_usd, last.price_aud, last.market_cap, last.change_24h)
+            _last_values[token_id] = last_values
+    if last_values is not None and _same_values(last_values, values):
+        try:
+            await _maybe_purge_old_price_snapshots(db, settings.SNAPSHOT_RETENTION_DAYS)
+        except Exception:
+            logger.exception("Purge failed during deduped price snapshot")
+        return None
 
     row = PriceSnapshot(
         token_id=token_id,
@@ -86,9 +129,11 @@ async def record_price_snapshot(
     db.add(row)
     await db.commit()
     await db.refresh(row)
+    _last_values[token_id] = values
+    _last_written_at[token_id] = time.monotonic()
 
     try:
-        await _purge_old_price_snapshots(db, settings.SNAPSHOT_RETENTION_DAYS)
+        await _maybe_purge_old_price_snapshots(db, settings.SNAPSHOT_RETENTION_DAYS)
     except Exception:
         logger.exception("Purge failed after recording price snapshot")
 
@@ -96,14 +141,17 @@ async def record_price_snapshot(
     return row
 
 
+_RANGE_DELTAS: Dict[str, timedelta] = {
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+    "90d": timedelta(days=90),
+}
+_DEFAULT_RANGE_DELTA = _RANGE_DELTAS["7d"]
+
+
 def _range_to_delta(range_key: str) -> timedelta:
-    mapping = {
-        "24h": timedelta(hours=24),
-        "7d": timedelta(days=7),
-        "30d": timedelta(days=30),
-        "90d": timedelta(days=90),
-    }
-    return mapping.get(range_key, timedelta(days=7))
+    return _RANGE_DELTAS.get(range_key, _DEFAULT_RANGE_DELTA)
 
 
 async def get_price_history(
@@ -1,14 +1,20 @@
 """Persist usage snapshots for historical trend charts.
 
 BUG-04: request-path writes now dedupe (skip identical consecutive values)
-and trigger retention purge based on SNAPSHOT_RETENTION_DAYS.
+and trigger retention purge based on SNAPSHOT_RETENTION_DAYS. The purge is a
+table-wide DELETE, so it runs at most once per _PURGE_INTERVAL_SECONDS rather
+than on every write. The last values written per scope are remembered in
+memory, so the dedupe check only queries the table once per scope per process.
+Request-path writes for a scope are also limited to one per
+SNAPSHOT_INTERVAL_SECONDS, so frequent polling does not hit the table every time.
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,6 +24,24 @@ from backend.models.db import UsageSnapshot
 
 logger = logging.getLogger(__name__)
 
+_PURGE_INTERVAL_SECONDS = 3600.0
+_last_purge_at: Optional[float] = None
+
+# scope -> (diem, usd, bundled_credits) of the newest row this process knows of.
+_last_values: Dict[str, Tuple[float, float, float]] = {}
+
+# scope -> monotonic time of the last inserted row, for SNAPSHOT_INTERVAL_SECONDS.
+_last_written_at: Dict[str, float] = {}
+
+
+def _within_snapshot_interval(scope: str, interval_seconds: int) -> bool:
+    last = _last_written_at.get(scope)
+    return last is not None and time.monotonic() - last < interval_seconds
+
+
+def _same_values(a: Tuple[float, float, float], b: Tuple[float, float, float]) -> bool:
+    return all(abs(x - y) < 1e-9 for x, y in zip(a, b))
+
 
 async def _purge_old_usage_snapshots(db: AsyncSession, retention_days: int) -> int:
     if retention_days <= 0:
@@ -32,6 +56,18 @@ async def _purge_old_usage_snapshots(db: AsyncSession, retention_days: int) -> i
     return deleted
 
 
+async def _maybe_purge_old_usage_snapshots(db: AsyncSession, retention_days: int) -> int:
+    """Run the retention purge if it has not run within _PURGE_INTERVAL_SECONDS."""
+    global _last_purge_at
+    now = time.monotonic()
+    if _last_purge_at is not None and now - _last_purge_at < _PURGE_INTERVAL_SECONDS:
+        return 0
+    # Only record the run once it succeeds, so a failed purge is retried next write.
+    deleted = await _purge_old_usage_snapshots(db, retention_days)
+    _last_purge_at = now
+    return deleted
+
+
 async def record_usage_snapshot(
     db: AsyncSession,
     *,
@@ -45,31 +81,36 @@ async def record_usage_snapshot(
 ) -> Optional[UsageSnapshot]:
     """Record a usage snapshot with dedupe + retention (BUG-04).
 
-    Returns the inserted row, or None if a duplicate (identical values) was skipped.
+    Returns the inserted row, or None if the write was skipped because it was
+    a duplicate (identical values) or inside SNAPSHOT_INTERVAL_SECONDS.
     """
     settings = get_settings()
 
+    if _within_snapshot_interval(scope, settings.SNAPSHOT_INTERVAL_SECONDS):
+        return None
+
     # Dedupe: skip if the last row for this scope has identical numeric values.
-    last_stmt = (
-        select(UsageSnapshot)
-        .where(UsageSnapshot.scope == scope)
-        .order_by(UsageSnapshot.timestamp.desc())
-        .limit(1)
-    )
-    last_res = await db.execute(last_stmt)
-    last = last_res.scalars().first()
-    if last is not None:
-        if (
-            abs((last.diem or 0) - (diem or 0)) < 1e-9
-            and abs((last.usd or 0) - (usd or 0)) < 1e-9
-            and abs((last.bundled_credits or 0) - (bundled_credits or 0)) < 1e-9
-        ):
-            # Still run purge occasionally even on skip
-            try:
-                await _purge_old_usage_snapshots(db, settings.SNAPSHOT_RETENTION_DAYS)
-            except Exception:
-                logger.exception("Purge failed during deduped usage snapshot")
-            return None
+    values = (diem or 0, usd or 0, bundled_credits or 0)
+    last_values = _last_values.get(scope)
+    if last_values is None:
+        last_stmt = (
+            select(UsageSnapshot)
+            .where(UsageSnapshot.scope == scope)
+            .order_by(UsageSnapshot.timestamp.desc())
+            .limit(1)
+        )
+        last_res = await db.execute(last_stmt)
+        last = last_res.scalars().first()
+        if last is not None:
+            last_values = (last.diem or 0, last.usd or 0, last.bundled_credits or 0)
+            _last_values[scope] = last_values
+    if last_values is not None and _same_values(last_values, values):
+        # Still give the (throttled) purge a chance even on skip
+        try:
+            await _maybe_purge_old_usage_snapshots(db, settings.SNAPSHOT_RETENTION_DAYS)
+        except Exception:
+            logger.exception("Purge failed during deduped usage snapshot")
+        return None
 
     row = UsageSnapshot(
         scope=scope,
@@ -83,10 +124,12 @@ async def record_usage_snapshot(
     db.add(row)
     await db.commit()
     await db.refresh(row)
+    _last_values[scope] = values
+    _last_written_at[scope] = time.monotonic()
 
     # Retention purge
     try:
-        await _purge_old_usage_snapshots(db, settings.SNAPSHOT_RETENTION_DAYS)
+        await _maybe_purge_old_usage_snapshots(db, settings.SNAPSHOT_RETENTION_DAYS)
     except Exception:
         logger.exception("Purge failed after recording usage snapshot")
 
@@ -0,0 +1,58 @@
+"""Unit tests for analytics SKU parsing helpers."""
+
+import pytest
+
+from backend.api.routes.analytics import (
+    _iso_date_key,
+    clean_model_name,
+    detect_model_type,
+    generate_recommendations,
+)
+
+
+@pytest.mark.parametrize(
+    "sku, name, model_type",
+    [
+        ("llama-3.3-70b-llm-input-mtoken", "llama-3.3-70b", "llm"),
+        ("qwen3-235b-llm-extended-cache-write-5m-mtoken", "qwen3-235b", "llm"),
+        ("text-embedding-bge-m3-llm-input-mtoken", "text-embedding-bge-m3", "embedding"),
+        ("kling-v3-pro-text-to-video-duration-rate-5s", "kling-v3-pro", "video"),
+        ("elevenlabs-music-duration-based-60s", "elevenlabs-music", "music"),
+        ("ace-step-15-duration-based-30s", "ace-step-15", "music"),
+        ("flux-dev-image-unit", "flux-dev", "image"),
+        ("nano-banana-edit-fixed-1img", "nano-banana", "image"),
+        ("seedream-v4-fixed-1K-websearch-1img", "seedream-v4", "image"),
+        ("credit-purchase", "credit-purchase", "other"),
+        ("Something-Unknown", "something-unknown", "other"),
+    ],
+)
+def test_sku_parsing(sku, name, model_type):
+    assert clean_model_name(sku) == name
+    assert detect_model_type(sku) == model_type
+
+
+@pytest.mark.parametrize(
+    "timestamp, expected",
+    [
+        ("2026-03-04T23:59:59Z", "2026-03-04"),
+        ("2026-03-04T23:59:59.123456+05:00", "2026-03-04"),
+        ("2026-03-04", "2026-03-04"),
+        ("20260304T000000", "2026-03-04"),
+        ("2026-03-31T00:00:00Z", "2026-03-31"),
+        ("2026-02-30T00:00:00Z", None),
+        ("2026-13-04T00:00:00Z", None),
+        ("not a date", None),
+    ],
+)
+def test_iso_date_key(timestamp, expected):
+    assert _iso_date_key(timestamp) == expected
+
+
+def test_recommendations_flag_latency_and_tolerate_missing_latency():
+    recs = generate_recommendations({
+        "slow": {"tokens": 1000, "cost": 1.0, "avg_response_time_ms": 6000.0},
+        "unknown": {"tokens": 1000, "cost": 1.0, "avg_response_time_ms": None},
+    })
+    perf = [r for r in recs if r["type"] == "performance"]
+    assert len(perf) == 1
+    assert "'slow'" in perf[0]["message"]
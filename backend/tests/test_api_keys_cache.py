@@ -0,0 +1,136 @@
+"""Unit tests for the in-process /api_keys cache in UsageTracker."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from backend.core import usage_tracker
+from backend.core.usage_tracker import UsageTracker
+
+
+class FakeClient:
+    def __init__(self, etag=None):
+        self.calls = 0
+        self.etag = etag
+        self.if_none_match = []
+
+    async def get(self, endpoint, params=None, timeout=30.0, headers=None):
+        assert endpoint == "/api_keys"
+        self.calls += 1
+        sent = (headers or {}).get("If-None-Match")
+        self.if_none_match.append(sent)
+        if self.etag and sent == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(
+            200,
+            json={
+                "data": [
+                    {
+                        "id": "key-1",
+                        "description": "Main",
+                        "usage": {"trailingSevenDays": {"diem": "1.5", "usd": "0.25"}},
+                        "createdAt": "2025-06-01T00:00:00Z",
+                        "isActive": True,
+                    }
+                ]
+            },
+            headers={"ETag": self.etag} if self.etag else None,
+        )
+
+
+@pytest.fixture(autouse=True)
+def _reset_key_caches(monkeypatch):
+    monkeypatch.setattr(usage_tracker, "_keys_cache", {})
+    monkeypatch.setattr(usage_tracker, "_keys_etags", {})
+    monkeypatch.setattr(usage_tracker, "_keys_inflight", {})
+
+
+def test_key_list_is_cached_within_ttl():
+    client = FakeClient()
+    tracker = UsageTracker("admin", client)
+
+    first = asyncio.run(tracker.fetch_api_keys_with_daily_usage())
+    second = asyncio.run(tracker.fetch_api_keys_with_daily_usage())
+
+    assert client.calls == 1
+    assert [k.id for k in second] == ["key-1"]
+    assert second[0].usage.diem == 1.5
+    assert first is not second
+
+
+def test_key_list_refetches_after_ttl():
+    client = FakeClient()
+    tracker = UsageTracker("admin", client)
+
+    asyncio.run(tracker.fetch_api_keys_with_daily_usage())
+    _, keys = usage_tracker._keys_cache["admin"]
+    usage_tracker._keys_cache["admin"] = (0.0, keys)  # force expiry
+    asyncio.run(tracker.fetch_api_keys_with_daily_usage())
+
+    assert client.calls == 2
+
+
+def test_stale_key_list_is_served_when_fetch_fails():
+    client = FakeClient()
+    tracker = UsageTracker("admin", client)
+    asyncio.run(tracker.fetch_api_keys_with_daily_usage())
+
+    async def failing_get(*args, **kwargs):
+        raise RuntimeError("venice down")
+
+    client.get = failing_get
+    _, keys = usage_tracker._keys_cache["admin"]
+    usage_tracker._keys_cache["admin"] = (0.0, keys)  # force expiry
+
+    stale = asyncio.run(tracker.fetch_api_keys_with_daily_usage())
+    assert [k.id for k in stale] == ["key-1"]
+
+    with pytest.raises(Exception, match="venice down"):
+        asyncio.run(tracker.fetch_api_keys_with_daily_usage(allow_stale=False))
+
+
+def test_key_cache_ttl_scales_with_upstream_latency():
+    assert usage_tracker._keys_cache_ttl(0.2) == usage_tracker._KEYS_CACHE_MIN_TTL
+    assert usage_tracker._keys_cache_ttl(3.0) == 60.0
+    assert usage_tracker._keys_cache_ttl(30.0) == usage_tracker._KEYS_CACHE_MAX_TTL
+
+
+def test_api_key_usage_from_dict_defaults():
+    key = usage_tracker.APIKeyUsage.from_dict({"id": "abcdefghijkl", "usage": None})
+    assert key.name == "Key efghijkl"
+    assert key.usage.diem == 0.0 and key.usage.usd == 0.0
+    assert key.is_active is True
+    assert key.last_used_at is None
+
+
+def test_concurrent_cold_fetches_share_one_request():
+
+    class SlowClient(FakeClient):
+        async def get(self, endpoint, **kwargs):
+            await asyncio.sleep(0.01)
+            return await super().get(endpoint, **kwargs)
+
+    client = SlowClient()
+    tracker = UsageTracker("admin", client)
+
+    async def run():
+        return await asyncio.gather(*(tracker.fetch_api_keys_with_daily_usage() for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert client.calls == 1
+    assert all([k.id for k in r] == ["key-1"] for r in results)
+    assert usage_tracker._keys_inflight == {}
+
+
+def test_unchanged_key_list_is_reused_on_304():
+    client = FakeClient(etag='"keys-v1"')
+    tracker = UsageTracker("admin", client)
+
+    asyncio.run(tracker.fetch_api_keys_with_daily_usage())
+    _, keys = usage_tracker._keys_cache["admin"]
+    usage_tracker._keys_cache["admin"] = (0.0, keys)  # force expiry
+    again = asyncio.run(tracker.fetch_api_keys_with_daily_usage())
+
+    assert client.if_none_match == [None, '"keys-v1"']
+    assert again[0] is keys[0]
@@ -0,0 +1,41 @@
+"""Unit tests for benchmark route helpers."""
+
+import asyncio
+
+from backend.api.routes import benchmark
+
+
+class FakeTraitsClient:
+    calls = 0
+    payload = {"data": {"image:default": {"id": "venice-sd35"}}}
+
+    def __init__(self, api_key):
+        pass
+
+    async def get_json(self, endpoint, **kwargs):
+        assert endpoint == "/models/traits"
+        FakeTraitsClient.calls += 1
+        if isinstance(self.payload, Exception):
+            raise self.payload
+        return self.payload
+
+
+def test_resolved_image_model_is_cached(monkeypatch):
+    monkeypatch.setattr(benchmark, "VeniceAPIClient", FakeTraitsClient)
+    monkeypatch.setattr(benchmark, "_image_model_cache", {})
+    FakeTraitsClient.calls = 0
+
+    assert asyncio.run(benchmark._resolve_image_model("k")) == "venice-sd35"
+    assert asyncio.run(benchmark._resolve_image_model("k")) == "venice-sd35"
+    assert FakeTraitsClient.calls == 1
+
+
+def test_image_model_fallback_is_not_cached(monkeypatch):
+    monkeypatch.setattr(benchmark, "VeniceAPIClient", FakeTraitsClient)
+    monkeypatch.setattr(benchmark, "_image_model_cache", {})
+    monkeypatch.setattr(FakeTraitsClient, "payload", RuntimeError("down"))
+    FakeTraitsClient.calls = 0
+
+    assert asyncio.run(benchmark._resolve_image_model("k")) == "flux-2-pro"
+    assert asyncio.run(benchmark._resolve_image_model("k")) == "flux-2-pro"
+    assert FakeTraitsClient.calls == 2
@@ -0,0 +1,41 @@
+"""Unit tests for concurrent /billing/usage pagination."""
+
+import asyncio
+
+import httpx
+
+from backend.core import usage_tracker
+
+
+class FakeClient:
+    def __init__(self, total_pages):
+        self.total_pages = total_pages
+        self.requested = []
+
+    async def get(self, endpoint, params=None, timeout=30.0):
+        page = params["page"]
+        self.requested.append(page)
+        # Later pages answer first to prove results are reassembled in page order.
+        await asyncio.sleep(0.001 * (self.total_pages - page))
+        return httpx.Response(
+            200,
+            json={
+                "data": [{"page": page}],
+                "pagination": {"totalPages": self.total_pages},
+            },
+        )
+
+
+def test_pages_are_returned_in_order():
+    client = FakeClient(total_pages=5)
+    entries = asyncio.run(usage_tracker.paginate_billing_usage(client, "a", "b"))
+    assert [e["page"] for e in entries] == [1, 2, 3, 4, 5]
+    assert client.requested[0] == 1
+
+
+def test_pagination_respects_max_pages(monkeypatch):
+    monkeypatch.setattr(usage_tracker.settings, "API_MAX_PAGES", 3)
+    client = FakeClient(total_pages=10)
+    entries = asyncio.run(usage_tracker.paginate_billing_usage(client, "a", "b"))
+    assert [e["page"] for e in entries] == [1, 2, 3]
+    assert sorted(client.requested) == [1, 2, 3]
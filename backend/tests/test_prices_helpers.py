@@ -0,0 +1,97 @@
+"""Unit tests for price route helpers."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from backend.api.routes import prices
+from backend.api.routes.prices import _to_float
+
+
+@pytest.fixture(autouse=True)
+def _reset_price_cache(monkeypatch):
+    monkeypatch.setattr(prices, "_price_cache", {})
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1, 1.0),
+        (0.0123, 0.0123),
+        ("4.5", 4.5),
+        (" -2e-3 ", -0.002),
+        (".5", 0.5),
+        ("", None),
+        ("abc", None),
+        ("1.2.3", None),
+        (None, None),
+        (True, None),
+        ({"usd": 1}, None),
+    ],
+)
+def test_to_float(value, expected):
+    assert _to_float(value) == expected
+
+
+def test_coingecko_fetches_share_one_client(monkeypatch):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params["ids"])
+        return httpx.Response(200, json={request.url.params["ids"]: {"usd": 1.5}})
+
+    shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(prices, "_coingecko_client", shared)
+
+    async def run():
+        first = await prices.fetch_coin_gecko_price("venice-token", ["usd"], base_url="https://cg.test")
+        second = await prices.fetch_coin_gecko_price("diem", ["usd"], base_url="https://cg.test")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == {"venice-token": {"usd": 1.5}}
+    assert second == {"diem": {"usd": 1.5}}
+    assert requests == ["venice-token", "diem"]
+    assert prices.get_coingecko_client() is shared
+
+
+def test_coingecko_price_is_reused_within_ttl(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"diem": {"usd": 2.0}})
+
+    monkeypatch.setattr(prices, "_coingecko_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def run():
+        first = await prices.fetch_coin_gecko_price("diem", ["usd"], base_url="https://cg.test")
+        second = await prices.fetch_coin_gecko_price("diem", ["usd"], base_url="https://cg.test")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == {"diem": {"usd": 2.0}}
+    assert len(calls) == 1
+
+
+def test_coingecko_stale_price_revalidates_with_etag(monkeypatch):
+    seen_etags = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"diem": {"usd": 2.0}}, headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(prices, "_coingecko_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(prices, "_PRICE_TTL_SECONDS", 0.0)
+
+    async def run():
+        first = await prices.fetch_coin_gecko_price("diem", ["usd"], base_url="https://cg.test")
+        second = await prices.fetch_coin_gecko_price("diem", ["usd"], base_url="https://cg.test")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == {"diem": {"usd": 2.0}}
+    assert seen_etags == [None, '"v1"']
@@ -0,0 +1,109 @@
+"""Unit tests for snapshot history service helpers."""
+
+import asyncio
+
+from backend.services import price_history_service, usage_history_service
+
+
+def test_usage_purge_is_throttled(monkeypatch):
+    calls = []
+
+    async def fake_purge(db, retention_days):
+        calls.append(retention_days)
+        return 0
+
+    monkeypatch.setattr(usage_history_service, "_purge_old_usage_snapshots", fake_purge)
+    monkeypatch.setattr(usage_history_service, "_last_purge_at", None)
+
+    async def run():
+        for _ in range(3):
+            await usage_history_service._maybe_purge_old_usage_snapshots(None, 90)
+
+    asyncio.run(run())
+    assert calls == [90]
+
+    monkeypatch.setattr(
+        usage_history_service,
+        "_last_purge_at",
+        usage_history_service._last_purge_at - usage_history_service._PURGE_INTERVAL_SECONDS,
+    )
+    asyncio.run(run())
+    assert calls == [90, 90]
+
+
+def test_price_purge_failure_is_retried(monkeypatch):
+    calls = []
+
+    async def flaky_purge(db, retention_days):
+        calls.append(retention_days)
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return 0
+
+    monkeypatch.setattr(price_history_service, "_purge_old_price_snapshots", flaky_purge)
+    monkeypatch.setattr(price_history_service, "_last_purge_at", None)
+
+    async def run():
+        try:
+            await price_history_service._maybe_purge_old_price_snapshots(None, 90)
+        except RuntimeError:
+            pass
+        await price_history_service._maybe_purge_old_price_snapshots(None, 90)
+        await price_history_service._maybe_purge_old_price_snapshots(None, 90)
+
+    asyncio.run(run())
+    assert calls == [90, 90]
+
+
+def test_usage_dedupe_uses_remembered_values(monkeypatch):
+    class NoQueryDB:
+        async def execute(self, stmt):
+            raise AssertionError("dedupe should not query when values are cached")
+
+    async def fake_maybe_purge(db, retention_days):
+        return 0
+
+    monkeypatch.setattr(usage_history_service, "_maybe_purge_old_usage_snapshots", fake_maybe_purge)
+    monkeypatch.setattr(usage_history_service, "_last_values", {"epoch": (1.5, 2.0, 0.0)})
+
+    row = asyncio.run(
+        usage_history_service.record_usage_snapshot(NoQueryDB(), scope="epoch", diem=1.5, usd=2.0)
+    )
+    assert row is None
+
+
+def test_price_dedupe_uses_remembered_values(monkeypatch):
+    class NoQueryDB:
+        async def execute(self, stmt):
+            raise AssertionError("dedupe should not query when values are cached")
+
+    async def fake_maybe_purge(db, retention_days):
+        return 0
+
+    monkeypatch.setattr(price_history_service, "_maybe_purge_old_price_snapshots", fake_maybe_purge)
+    monkeypatch.setattr(
+        price_history_service, "_last_values", {"venice-token": (1.25, None, 1e8, -2.0)}
+    )
+
+    row = asyncio.run(
+        price_history_service.record_price_snapshot(
+            NoQueryDB(), token_id="venice-token", price_usd=1.25, market_cap=1e8, change_24h=-2.0
+        )
+    )
+    assert row is None
+
+
+def test_usage_snapshot_respects_interval(monkeypatch):
+    class NoQueryDB:
+        async def execute(self, stmt):
+            raise AssertionError("throttled snapshot should not touch the database")
+
+    monkeypatch.setattr(usage_history_service, "_last_values", {})
+    monkeypatch.setattr(
+        usage_history_service, "_last_written_at", {"daily": usage_history_service.time.monotonic()}
+    )
+
+    row = asyncio.run(
+        usage_history_service.record_usage_snapshot(NoQueryDB(), scope="daily", diem=3.0, usd=1.0)
+    )
+    assert row is None
@@ -0,0 +1,114 @@
+"""Unit tests for VeniceAPIClient conditional GET handling."""
+
+import asyncio
+
+import httpx
+
+from backend.core import venice_api_client
+from backend.core.venice_api_client import VeniceAPIClient
+
+
+def test_get_json_revalidates_with_etag(monkeypatch):
+    seen_if_none_match = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_if_none_match.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": [1, 2]}, headers={"ETag": '"v1"'})
+
+    transport_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(venice_api_client, "get_http_client", lambda: transport_client)
+    monkeypatch.setattr(venice_api_client, "_etag_cache", {})
+
+    client = VeniceAPIClient("test-key")
+
+    async def run():
+        first = await client.get_json("/api_keys")
+        first["data"].append(3)  # callers must not be able to corrupt the cached body
+        second = await client.get_json("/api_keys")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert second == {"data": [1, 2]}
+    assert seen_if_none_match == [None, '"v1"']
+
+
+def test_get_json_skips_etag_cache_for_caller_params(monkeypatch):
+    seen_if_none_match = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_if_none_match.append(request.headers.get("if-none-match"))
+        return httpx.Response(200, json={"data": []}, headers={"ETag": '"v1"'})
+
+    transport_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(venice_api_client, "get_http_client", lambda: transport_client)
+    monkeypatch.setattr(venice_api_client, "_etag_cache", {})
+
+    client = VeniceAPIClient("test-key")
+    params = {"startDate": "2026-01-01", "endDate": "2026-01-31"}
+
+    async def run():
+        await client.get_json("/billing/usage", params=params)
+        await client.get_json("/billing/usage", params=params)
+
+    asyncio.run(run())
+    assert seen_if_none_match == [None, None]
+    assert venice_api_client._etag_cache == {}
+
+
+def test_retry_after_header_parsing():
+    assert venice_api_client._retry_after_seconds("3") == 3.0
+    assert venice_api_client._retry_after_seconds(None) is None
+    assert venice_api_client._retry_after_seconds("not a date") is None
+    assert venice_api_client._retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_get_retries_429_honouring_retry_after(monkeypatch):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"ok": True})
+
+    transport_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(venice_api_client, "get_http_client", lambda: transport_client)
+    monkeypatch.setattr(venice_api_client, "_etag_cache", {})
+
+    result = asyncio.run(VeniceAPIClient("test-key").get_json("/billing/balance"))
+    assert result == {"ok": True}
+    assert len(calls) == 2
+
+
+def test_post_json_sends_orjson_body(monkeypatch):
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.headers.get("content-type"), request.content))
+        return httpx.Response(200, json={"result": "0x1"})
+
+    transport_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(venice_api_client, "get_http_client", lambda: transport_client)
+
+    result = asyncio.run(VeniceAPIClient("test-key").post_json("/crypto/rpc/base", data={"id": 1}))
+    assert result == {"result": "0x1"}
+    assert seen == [("application/json", b'{"id":1}')]
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setattr(venice_api_client.settings, "VENICE_HTTP2", True)
+    monkeypatch.setattr(venice_api_client.importlib.util, "find_spec", lambda name: None)
+    assert venice_api_client._http2_enabled() is False
+
+    monkeypatch.setattr(venice_api_client.settings, "VENICE_HTTP2", False)
+    assert venice_api_client._http2_enabled() is False
+
+
+def test_request_headers_are_built_once_per_key():
+    first = VeniceAPIClient("key-a")
+    second = VeniceAPIClient("key-a")
+    assert first.headers is second.headers
+    assert first.headers["authorization"] == "Bearer key-a"
+    assert VeniceAPIClient("key-b").headers["authorization"] == "Bearer key-b"
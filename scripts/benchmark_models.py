@@ -452,6 +452,16 @@ async def chat_completion(
         }
 
 
+async def _read_error_snippet(resp: httpx.Response, limit: int = 300) -> bytes:
+    """Read at most ``limit`` bytes of a streamed error body; the rest is never buffered."""
+    snippet = bytearray()
+    async for chunk in resp.aiter_bytes():
+        snippet += chunk
+        if len(snippet) >= limit:
+            break
+    return bytes(snippet[:limit])
+
+
 async def chat_completion_stream(
     client: httpx.AsyncClient,
     model_id: str,
@@ -488,7 +498,7 @@ async def chat_completion_stream(
             timeout=REQUEST_TIMEOUT_S,
         ) as resp:
             if resp.status_code >= 400:
-                body = await resp.aread()
+                body = await _read_error_snippet(resp)
                 latency_ms = (time.perf_counter() - t0) * 1000
                 return {
                     "ok": False,
@@ -496,7 +506,7 @@ async def chat_completion_stream(
                     "usage": {},
                     "latency_ms": latency_ms,
                     "ttft_ms": None,
-                    "error": f"HTTP {resp.status_code}: {body[:300]!r}",
+                    "error": f"HTTP {resp.status_code}: {body!r}",
                 }
 
             async for line in resp.aiter_lines():
@@ -1409,11 +1419,14 @@ async def reconcile_billed_costs(
     models_results: list[dict],
     run_start: datetime,
     run_end: datetime,
+    auth_headers: Optional[dict] = None,
 ) -> dict:
     """Query /billing/usage and match entries to recorded request IDs.
 
     Returns a mapping of request_id -> list of billing entries. Also updates
     each model result with actual_billed fields per category and model total.
+    ``auth_headers`` override the client's defaults per request, so the admin
+    key can be used over the benchmark client's already-open connections.
     """
     # Collect all recorded request IDs grouped by model/category
     request_ids: set[str] = set()
@@ -1447,6 +1460,7 @@ async def reconcile_billed_costs(
         try:
             resp = await client.get(
                 f"{VENICE_BASE}/billing/usage",
+                headers=auth_headers,
                 params={
                     "startDate": start_str,
                     "endDate": end_str,
@@ -1786,19 +1800,13 @@ async def async_main(args: argparse.Namespace) -> int:
         # Reconcile actual billed costs if admin key provided
         if args.admin_key:
             run_end = datetime.now(timezone.utc)
-            async with httpx.AsyncClient(
-                headers={
-                    "Authorization": f"Bearer {args.admin_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=REQUEST_TIMEOUT_S,
-            ) as reconcile_client:
-                await reconcile_billed_costs(
-                    client=reconcile_client,
-                    models_results=results,
-                    run_start=run_start,
-                    run_end=run_end,
-                )
+            await reconcile_billed_costs(
+                client=client,
+                models_results=results,
+                run_start=run_start,
+                run_end=run_end,
+                auth_headers={"Authorization": f"Bearer {args.admin_key}"},
+            )
             # Re-write results with actual_billed fields
             out_path = write_results(Path(args.output), results)
         else:
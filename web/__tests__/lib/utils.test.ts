@@ -1,4 +1,4 @@
-import { cn, formatCurrency, formatNumber, formatPercent } from '@/lib/utils'
+import { cn, formatCurrency, formatDate, formatMonthDay, formatNumber, formatPercent, getPriorityStyles, getTypeColor } from '@/lib/utils'
 
 describe('cn', () => {
   it('merges class names', () => {
@@ -48,6 +48,18 @@ describe('formatCurrency', () => {
     const result = formatCurrency(1.123456)
     expect(result).toBe('$1.1235')
   })
+
+  it('returns the same string for repeated values in different currencies', () => {
+    expect(formatCurrency(3.5)).toBe('$3.50')
+    expect(formatCurrency(3.5)).toBe('$3.50')
+    expect(formatCurrency(3.5, 'AUD')).not.toBe('$3.50')
+  })
+
+  it('keeps formatting correctly after the memo cache fills up', () => {
+    for (let i = 0; i < 1100; i++) formatCurrency(i)
+    expect(formatCurrency(1)).toBe('$1.00')
+    expect(formatCurrency(1099)).toBe('$1,099.00')
+  })
 })
 
 describe('formatNumber', () => {
@@ -85,3 +97,44 @@ describe('formatPercent', () => {
     expect(formatPercent(33.3333)).toBe('33.33%')
   })
 })
+
+describe('getTypeColor', () => {
+  it('matches known types case-insensitively', () => {
+    expect(getTypeColor('TEXT')).toBe(getTypeColor('text'))
+    expect(getTypeColor('image')).toContain('text-chart-5')
+  })
+
+  it('falls back to muted styling for unknown types', () => {
+    expect(getTypeColor('embedding')).toBe('bg-muted text-muted-foreground border-muted')
+  })
+})
+
+describe('getPriorityStyles', () => {
+  it('returns the class string for each priority', () => {
+    expect(getPriorityStyles('high')).toContain('text-destructive')
+    expect(getPriorityStyles('medium')).toContain('text-warning')
+    expect(getPriorityStyles('low')).toContain('text-success')
+  })
+})
+
+describe('cached formatters', () => {
+  it('keeps currencies and decimal counts independent across calls', () => {
+    expect(formatCurrency(1, 'USD')).toBe('$1.00')
+    expect(formatCurrency(1, 'EUR')).toBe('€1.00')
+    expect(formatCurrency(2, 'USD')).toBe('$2.00')
+    expect(formatNumber(1.5, 0)).toBe('2')
+    expect(formatNumber(1.5, 3)).toBe('1.500')
+    expect(formatNumber(1.5, 0)).toBe('2')
+  })
+})
+
+describe('date formatters', () => {
+  it('formats dates with shared formatters', () => {
+    expect(formatDate('2025-03-04T12:00:00')).toBe('Mar 4, 2025')
+    expect(formatMonthDay('2025-03-04T12:00:00')).toBe('Mar 4')
+  })
+
+  it('returns Invalid Date instead of throwing on bad input', () => {
+    expect(formatDate('')).toBe('Invalid Date')
+  })
+})
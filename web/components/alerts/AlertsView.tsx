@@ -17,6 +17,9 @@ const METRIC_OPTIONS = [
   { value: 'diem_price_usd', label: 'DIEM price (USD)' },
 ]
 
+// Shared by every form control below; defined once rather than per field.
+const FIELD_CLASS = 'mt-1 w-full rounded-md border border-input bg-background px-3 py-2 text-sm'
+
 export function AlertsView() {
   const queryClient = useQueryClient()
   const { data: alertsData, isLoading: alertsLoading, isError: alertsError } = useAlerts()
@@ -102,7 +105,7 @@ export function AlertsView() {
                   required
                   value={form.name}
                   onChange={(e) => setForm({ ...form, name: e.target.value })}
-                  className="mt-1 w-full rounded-md border border-input bg-background px-3 py-2 text-sm"
+                  className={FIELD_CLASS}
                 />
               </div>
               <div className="grid grid-cols-2 gap-4">
@@ -116,7 +119,7 @@ export function AlertsView() {
                         alert_type: e.target.value as AlertConfigCreate['alert_type'],
                       })
                     }
-                    className="mt-1 w-full rounded-md border border-input bg-background px-3 py-2 text-sm"
+                    className={FIELD_CLASS}
                   >
                     <option value="usage_percent">Usage %</option>
                     <option value="balance_threshold">Balance</option>
@@ -128,7 +131,7 @@ export function AlertsView() {
                   <select
                     value={form.metric}
                     onChange={(e) => setForm({ ...form, metric: e.target.value })}
-                    className="mt-1 w-full rounded-md border border-input bg-background px-3 py-2 text-sm"
+                    className={FIELD_CLASS}
                   >
                     {METRIC_OPTIONS.map((m) => (
                       <option key={m.value} value={m.value}>
@@ -147,7 +150,7 @@ export function AlertsView() {
                     required
                     value={form.threshold}
                     onChange={(e) => setForm({ ...form, threshold: Number(e.target.value) })}
-                    className="mt-1 w-full rounded-md border border-input bg-background px-3 py-2 text-sm"
+                    className={FIELD_CLASS}
                   />
                 </div>
                 <div>
@@ -160,7 +163,7 @@ export function AlertsView() {
                         comparison: e.target.value as 'gte' | 'lte',
                       })
                     }
-                    className="mt-1 w-full rounded-md border border-input bg-background px-3 py-2 text-sm"
+                    className={FIELD_CLASS}
                   >
                     <option value="gte">≥ greater or equal</option>
                     <option value="lte">≤ less or equal</option>
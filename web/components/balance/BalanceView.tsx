@@ -5,6 +5,10 @@ import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/com
 import { formatNumber, formatCurrency, formatDateTime } from '@/lib/utils'
 import { Wallet, TrendingUp, Clock, PieChart, Activity, AlertCircle } from 'lucide-react'
 
+function consumedLabel(percent: number | null | undefined): string {
+  return percent != null ? `${percent.toFixed(1)}%` : '—'
+}
+
 export function BalanceView() {
   const { data: balance, isLoading: balanceLoading, isError: balanceError } = useBalance()
   const { data: epochUsage, isLoading: epochLoading, isError: epochError } = useEpochUsage()
@@ -83,7 +87,7 @@ export function BalanceView() {
               </div>
               <div className="mt-2 h-3 bg-muted rounded-full overflow-hidden">
                 <div 
-                  className="h-full bg-primary rounded-full transition-all"
+                  className="h-full bg-primary rounded-full transition-[width]"
                   style={{ width: `${Math.min(consumptionRate, 100)}%` }}
                 />
               </div>
@@ -180,7 +184,7 @@ export function BalanceView() {
                   <p className="text-sm text-muted-foreground mb-2">Epoch Progress</p>
                   <div className="h-4 bg-muted rounded-full overflow-hidden">
                     <div 
-                      className="h-full bg-primary rounded-full transition-all"
+                      className="h-full bg-primary rounded-full transition-[width]"
                       style={{ width: `${Math.min(epochProgress, 100)}%` }}
                     />
                   </div>
@@ -195,7 +199,7 @@ export function BalanceView() {
                       <p className="text-sm text-muted-foreground">Usage (Consumed % of limit/allocation)</p>
                     </div>
                     <p className="text-lg font-semibold">
-                      DIEM: {balance.diem_consumed_percent != null ? balance.diem_consumed_percent.toFixed(1) + '%' : '—'} | USD: {balance.usd_consumed_percent != null ? balance.usd_consumed_percent.toFixed(1) + '%' : '—'}
+                      DIEM: {consumedLabel(balance.diem_consumed_percent)} | USD: {consumedLabel(balance.usd_consumed_percent)}
                     </p>
                     <p className="text-[10px] text-muted-foreground mt-1">Same rule (e.g. gte 80) now means the same thing for both currencies.</p>
                   </div>
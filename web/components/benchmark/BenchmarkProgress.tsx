@@ -8,6 +8,24 @@ interface LogLine {
   type: 'log' | 'progress' | 'error' | 'done' | 'system'
 }
 
+type JobStatus = 'running' | 'done' | 'error'
+
+// Status and log-line styles are fixed per state, so they are looked up
+// from shared tables instead of re-deriving ternary chains on every line.
+const STATUS_STYLES: Record<JobStatus, { color: string; label: string }> = {
+  running: { color: 'text-amber-400', label: 'Running' },
+  done: { color: 'text-green-400', label: 'Complete' },
+  error: { color: 'text-red-400', label: 'Error' },
+}
+
+const LINE_CLASS: Record<LogLine['type'], string> = {
+  progress: 'text-cyan-400',
+  done: 'text-green-400',
+  error: 'text-red-400',
+  system: 'text-muted-foreground',
+  log: 'text-gray-300',
+}
+
 interface Props {
   jobId: string
   onComplete: (runId: string) => void
@@ -17,7 +35,7 @@ interface Props {
 export function BenchmarkProgress({ jobId, onComplete, onError }: Props) {
   const [lines, setLines] = useState<LogLine[]>([])
   const [progress, setProgress] = useState<{ done: number; total: number } | null>(null)
-  const [status, setStatus] = useState<'running' | 'done' | 'error'>('running')
+  const [status, setStatus] = useState<JobStatus>('running')
   const bottomRef = useRef<HTMLDivElement>(null)
   const esRef = useRef<EventSource | null>(null)
   const seenLinesRef = useRef<Set<string>>(new Set())
@@ -31,11 +49,37 @@ export function BenchmarkProgress({ jobId, onComplete, onError }: Props) {
     onErrorRef.current = onError
   }, [onComplete, onError])
 
+  // A busy run can emit dozens of SSE lines per frame (and a status poll
+  // replays a whole backlog). Lines are buffered and appended once per
+  // animation frame, so a burst costs one array copy and one render.
+  const pendingLinesRef = useRef<LogLine[]>([])
+  const flushFrameRef = useRef<number | null>(null)
+
+  const flushLines = () => {
+    flushFrameRef.current = null
+    const pending = pendingLinesRef.current
+    if (pending.length === 0) return
+    pendingLinesRef.current = []
+    setLines((prev) => [...prev, ...pending])
+  }
+
   const pushLine = (text: string, type: LogLine['type']) => {
     const key = `${type}:${text}`
     if (seenLinesRef.current.has(key)) return
     seenLinesRef.current.add(key)
-    setLines((prev) => [...prev, { text, type }])
+    pendingLinesRef.current.push({ text, type })
+    if (flushFrameRef.current == null) {
+      flushFrameRef.current = window.requestAnimationFrame(flushLines)
+    }
+  }
+
+  // Appends any buffered lines right away, e.g. when the stream ends or the
+  // view unmounts, so the final status lines are never dropped.
+  const flushNow = () => {
+    if (flushFrameRef.current != null) {
+      window.cancelAnimationFrame(flushFrameRef.current)
+    }
+    flushLines()
   }
 
   const markDone = (runId: string | null | undefined) => {
@@ -43,6 +87,7 @@ export function BenchmarkProgress({ jobId, onComplete, onError }: Props) {
     finishedRef.current = true
     setStatus('done')
     pushLine(`Benchmark complete. Run ID: ${runId ?? 'unknown'}`, 'done')
+    flushNow()
     esRef.current?.close()
     if (runId) onCompleteRef.current(runId)
   }
@@ -52,6 +97,7 @@ export function BenchmarkProgress({ jobId, onComplete, onError }: Props) {
     finishedRef.current = true
     setStatus('error')
     pushLine(message, 'error')
+    flushNow()
     esRef.current?.close()
     onErrorRef.current?.()
   }
@@ -172,6 +218,7 @@ export function BenchmarkProgress({ jobId, onComplete, onError }: Props) {
       es.close()
       esRef.current = null
       stopPolling()
+      flushNow()
     }
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [jobId])
@@ -180,9 +227,7 @@ export function BenchmarkProgress({ jobId, onComplete, onError }: Props) {
     bottomRef.current?.scrollIntoView({ behavior: 'smooth' })
   }, [lines])
 
-  const statusColor =
-    status === 'done' ? 'text-green-400' : status === 'error' ? 'text-red-400' : 'text-amber-400'
-  const statusLabel = status === 'done' ? 'Complete' : status === 'error' ? 'Error' : 'Running'
+  const { color: statusColor, label: statusLabel } = STATUS_STYLES[status]
 
   const [cancelling, setCancelling] = useState(false)
   const onCancel = async () => {
@@ -232,23 +277,11 @@ export function BenchmarkProgress({ jobId, onComplete, onError }: Props) {
       )}
 
       <div className="bg-black/80 rounded-lg border border-border font-mono text-xs h-64 overflow-y-auto p-3 space-y-0.5">
-        {lines.map((line, i) => {
-          const cls =
-            line.type === 'progress'
-              ? 'text-cyan-400'
-              : line.type === 'done'
-                ? 'text-green-400'
-                : line.type === 'error'
-                  ? 'text-red-400'
-                  : line.type === 'system'
-                    ? 'text-muted-foreground'
-                    : 'text-gray-300'
-          return (
-            <div key={`${i}-${line.type}-${line.text.slice(0, 48)}`} className={cls}>
-              {line.text}
-            </div>
-          )
-        })}
+        {lines.map((line, i) => (
+          <div key={`${i}-${line.type}-${line.text.slice(0, 48)}`} className={LINE_CLASS[line.type]}>
+            {line.text}
+          </div>
+        ))}
         <div ref={bottomRef} />
       </div>
     </div>
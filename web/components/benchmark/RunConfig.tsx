@@ -12,6 +12,8 @@ interface Props {
 
 const ALL_TESTS = ['T1', 'T2', 'T3', 'T4', 'T5', 'T6', 'T7', 'T8']
 
+const LABEL_CLASS = 'text-xs font-medium text-muted-foreground uppercase tracking-wide block mb-1.5'
+
 export function RunConfig({ onStart, isRunning }: Props) {
   const [selectedModels, setSelectedModels] = useState<string[] | null>(null) // null = all
   const [selectedTests, setSelectedTests] = useState<string[]>(ALL_TESTS)
@@ -101,7 +103,7 @@ export function RunConfig({ onStart, isRunning }: Props) {
 
         <div className="grid grid-cols-2 gap-4">
           <div>
-            <label className="text-xs font-medium text-muted-foreground uppercase tracking-wide block mb-1.5">
+            <label className={LABEL_CLASS}>
               Iterations per test: <span className="text-foreground font-semibold">{iterations}</span>
             </label>
             <input
@@ -121,7 +123,7 @@ export function RunConfig({ onStart, isRunning }: Props) {
           </div>
 
           <div>
-            <label className="text-xs font-medium text-muted-foreground uppercase tracking-wide block mb-1.5">
+            <label className={LABEL_CLASS}>
               Parallel workers: <span className="text-foreground font-semibold">{workers}</span>
             </label>
             <input
@@ -142,7 +144,7 @@ export function RunConfig({ onStart, isRunning }: Props) {
         </div>
 
         <div>
-          <label className="text-xs font-medium text-muted-foreground uppercase tracking-wide block mb-1.5">
+          <label className={LABEL_CLASS}>
             Privacy filter
           </label>
           <div className="flex gap-3">
@@ -1,6 +1,6 @@
 'use client'
 
-import { useState, useMemo } from 'react'
+import { memo, useState, useMemo } from 'react'
 import { useAPIKeysUsage } from '@/lib/hooks'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@/components/ui/table'
@@ -10,29 +10,42 @@ import { BarChart3, ArrowUpDown, ArrowUp, ArrowDown } from 'lucide-react'
 
 type SortMode = 'usage_high' | 'usage_low' | 'name_asc' | 'name_desc' | 'recent'
 
+const nameCollator = new Intl.Collator()
+
 export function UsageLeaderboardCard() {
   const { data: usage, isLoading, isError } = useAPIKeysUsage()
   const [sortMode, setSortMode] = useState<SortMode>('usage_high')
 
   const sortedKeys = useMemo(() => {
     if (!usage?.keys) return []
-    
-    const keys = [...usage.keys]
-    
+
+    // Decorate each key with its sort value once so the comparator only
+    // compares primitives (no Date parsing per comparison).
+    const decorated = usage.keys.map((key) => ({
+      key,
+      usage: key.diem_usage,
+      created: Date.parse(key.created_at) || 0,
+    }))
+
     switch (sortMode) {
       case 'usage_high':
-        return keys.sort((a, b) => b.diem_usage - a.diem_usage)
+        decorated.sort((a, b) => b.usage - a.usage)
+        break
       case 'usage_low':
-        return keys.sort((a, b) => a.diem_usage - b.diem_usage)
+        decorated.sort((a, b) => a.usage - b.usage)
+        break
       case 'name_asc':
-        return keys.sort((a, b) => a.name.localeCompare(b.name))
+        decorated.sort((a, b) => nameCollator.compare(a.key.name, b.key.name))
+        break
       case 'name_desc':
-        return keys.sort((a, b) => b.name.localeCompare(a.name))
+        decorated.sort((a, b) => nameCollator.compare(b.key.name, a.key.name))
+        break
       case 'recent':
-        return keys.sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime())
-      default:
-        return keys
+        decorated.sort((a, b) => b.created - a.created)
+        break
     }
+
+    return decorated.map((d) => d.key)
   }, [usage?.keys, sortMode])
 
   const maxUsage = useMemo(() => {
@@ -111,40 +124,16 @@ export function UsageLeaderboardCard() {
               </TableRow>
             </TableHeader>
             <TableBody>
-              {sortedKeys.map((key) => {
-                const percentile = getUsagePercentile(key.diem_usage, maxUsage)
-                const barColor = getUsageBarColor(percentile)
-                
-                return (
-                  <TableRow key={key.id}>
-                    <TableCell className="font-medium">{key.name}</TableCell>
-                    <TableCell>
-                      <Badge variant={key.is_active ? "success" : "secondary"}>
-                        {key.is_active ? 'Active' : 'Inactive'}
-                      </Badge>
-                    </TableCell>
-                    <TableCell>
-                      <div className="space-y-1">
-                        <div className="flex items-center justify-between text-sm">
-                          <span className="font-mono">{formatNumber(key.diem_usage, 4)}</span>
-                          <span className="text-xs text-muted-foreground">
-                            {percentile.toFixed(1)}%
-                          </span>
-                        </div>
-                        <div className="h-2 bg-muted rounded-full overflow-hidden">
-                          <div 
-                            className={cn("h-full rounded-full transition-all", barColor)}
-                            style={{ width: `${Math.min(percentile, 100)}%` }}
-                          />
-                        </div>
-                      </div>
-                    </TableCell>
-                    <TableCell className="text-right font-mono">
-                      {formatCurrency(key.usd_usage)}
-                    </TableCell>
-                  </TableRow>
-                )
-              })}
+              {sortedKeys.map((key) => (
+                <KeyUsageRow
+                  key={key.id}
+                  name={key.name}
+                  isActive={key.is_active}
+                  diemUsage={key.diem_usage}
+                  usdUsage={key.usd_usage}
+                  maxUsage={maxUsage}
+                />
+              ))}
             </TableBody>
           </Table>
         )}
@@ -153,6 +142,61 @@ export function UsageLeaderboardCard() {
   )
 }
 
+interface KeyUsageRowProps {
+  name: string
+  isActive: boolean
+  diemUsage: number
+  usdUsage: number
+  maxUsage: number
+}
+
+// Memoised on primitive props: re-sorting or a refetch with unchanged
+// numbers only moves existing rows instead of re-rendering them.
+const KeyUsageRow = memo(function KeyUsageRow({
+  name,
+  isActive,
+  diemUsage,
+  usdUsage,
+  maxUsage,
+}: KeyUsageRowProps) {
+  const percentile = getUsagePercentile(diemUsage, maxUsage)
+  const barColor = getUsageBarColor(percentile)
+  // A change to any other key moves maxUsage and re-renders every row; the
+  // row's own figures are only re-formatted when they actually change.
+  const diemLabel = useMemo(() => formatNumber(diemUsage, 4), [diemUsage])
+  const usdLabel = useMemo(() => formatCurrency(usdUsage), [usdUsage])
+
+  return (
+    <TableRow>
+      <TableCell className="font-medium">{name}</TableCell>
+      <TableCell>
+        <Badge variant={isActive ? "success" : "secondary"}>
+          {isActive ? 'Active' : 'Inactive'}
+        </Badge>
+      </TableCell>
+      <TableCell>
+        <div className="space-y-1">
+          <div className="flex items-center justify-between text-sm">
+            <span className="font-mono">{diemLabel}</span>
+            <span className="text-xs text-muted-foreground">
+              {percentile.toFixed(1)}%
+            </span>
+          </div>
+          <div className="h-2 bg-muted rounded-full overflow-hidden">
+            <div 
+              className={cn("h-full rounded-full transition-[width]", barColor)}
+              style={{ width: `${Math.min(percentile, 100)}%` }}
+            />
+          </div>
+        </div>
+      </TableCell>
+      <TableCell className="text-right font-mono">
+        {usdLabel}
+      </TableCell>
+    </TableRow>
+  )
+})
+
 function SortButton({ label, active, onClick }: { label: string; active: boolean; onClick: () => void }) {
   return (
     <button
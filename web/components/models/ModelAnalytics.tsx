@@ -19,7 +19,7 @@ import {
   Legend,
 } from 'recharts'
 import { Activity, DollarSign, Clock, Zap, TrendingUp, AlertCircle, CheckCircle } from 'lucide-react'
-import { cn, getPriorityStyles } from '@/lib/utils'
+import { cn, formatMonthDay, getPriorityStyles } from '@/lib/utils'
 
 const CHART_COLORS = [
   'hsl(var(--chart-1))',
@@ -44,6 +44,8 @@ interface ModelAnalyticsProps {
   className?: string
 }
 
+const SELECT_CLASS = 'px-3 py-1.5 text-sm rounded-md border border-input bg-background focus:outline-none focus:ring-2 focus:ring-ring'
+
 export function ModelAnalytics({ className }: ModelAnalyticsProps) {
   const [days, setDays] = useState(7)
   const [modelType, setModelType] = useState<string>('all')
@@ -126,7 +128,7 @@ export function ModelAnalytics({ className }: ModelAnalyticsProps) {
   }))
 
   const dailyChartData = dailyData?.daily_usage.map((d) => ({
-    date: new Date(d.date).toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
+    date: formatMonthDay(d.date),
     requests: d.requests,
     tokens: d.tokens / 1000,
     cost: d.cost,
@@ -151,7 +153,7 @@ export function ModelAnalytics({ className }: ModelAnalyticsProps) {
           <select
             value={modelType}
             onChange={(e) => setModelType(e.target.value)}
-            className="px-3 py-1.5 text-sm rounded-md border border-input bg-background focus:outline-none focus:ring-2 focus:ring-ring"
+            className={SELECT_CLASS}
           >
             <option value="all">All types</option>
             {availableTypes.map((t) => (
@@ -163,7 +165,7 @@ export function ModelAnalytics({ className }: ModelAnalyticsProps) {
           <select
             value={days}
             onChange={(e) => setDays(Number(e.target.value))}
-            className="px-3 py-1.5 text-sm rounded-md border border-input bg-background focus:outline-none focus:ring-2 focus:ring-ring"
+            className={SELECT_CLASS}
           >
             <option value={1}>Last 1 day</option>
             <option value={3}>Last 3 days</option>
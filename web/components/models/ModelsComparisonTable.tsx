@@ -438,6 +438,21 @@ function getCellValue(model: Model, columnKey: string): { display: string; sortV
   return { display, sortValue }
 }
 
+// Cell class names depend only on a column flag or a yes/no value, so they are
+// merged once here rather than through cn() for every cell on every render.
+const HEADER_CLASS = "px-3 py-2 text-left font-medium text-muted-foreground whitespace-nowrap"
+const SORTABLE_HEADER_CLASS = cn(HEADER_CLASS, "cursor-pointer hover:text-foreground select-none")
+const CELL_CLASS = "px-3 py-2 whitespace-nowrap"
+const MODEL_CELL_CLASS = cn(CELL_CLASS, "font-medium")
+const BOOLEAN_BADGE_BASE = "inline-flex items-center justify-center w-5 h-5 rounded text-xs font-medium"
+const BOOLEAN_BADGE_YES = cn(BOOLEAN_BADGE_BASE, "bg-success/10 text-success")
+const BOOLEAN_BADGE_NO = cn(BOOLEAN_BADGE_BASE, "bg-destructive/10 text-destructive")
+
+const BOOLEAN_COLUMNS = new Set([
+  'vision', 'functions', 'web_search', 'reasoning', 'logprobs', 'response_schema',
+  'optimized_for_code', 'audio_input', 'video_input', 'audio', 'audio_configurable',
+])
+
 export function ModelsComparisonTable({
   models,
   modelType,
@@ -530,10 +545,7 @@ export function ModelsComparisonTable({
             {visibleColumns.map((column) => (
               <th
                 key={column.key}
-                className={cn(
-                  "px-3 py-2 text-left font-medium text-muted-foreground whitespace-nowrap",
-                  column.sortable && "cursor-pointer hover:text-foreground select-none"
-                )}
+                className={column.sortable ? SORTABLE_HEADER_CLASS : HEADER_CLASS}
                 style={{ minWidth: column.minWidth }}
                 onClick={() => column.sortable && handleSort(column.key)}
                 title={column.tooltip}
@@ -566,25 +578,16 @@ export function ModelsComparisonTable({
             >
               {visibleColumns.map((column) => {
                 const { display, sortValue } = getCellValue(model, column.key)
-                const isBoolean = typeof sortValue === 'number' && (sortValue === 0 || sortValue === 1) && 
-                  ['vision', 'functions', 'web_search', 'reasoning', 'logprobs', 'response_schema', 
-                   'optimized_for_code', 'audio_input', 'video_input', 'audio', 'audio_configurable'].includes(column.key)
+                const isBoolean = typeof sortValue === 'number' && (sortValue === 0 || sortValue === 1) &&
+                  BOOLEAN_COLUMNS.has(column.key)
                 
                 return (
                   <td
                     key={column.key}
-                    className={cn(
-                      "px-3 py-2 whitespace-nowrap",
-                      column.key === 'model' && "font-medium"
-                    )}
+                    className={column.key === 'model' ? MODEL_CELL_CLASS : CELL_CLASS}
                   >
                     {isBoolean ? (
-                      <span className={cn(
-                        "inline-flex items-center justify-center w-5 h-5 rounded text-xs font-medium",
-                        sortValue === 1 
-                          ? "bg-success/10 text-success" 
-                          : "bg-destructive/10 text-destructive"
-                      )}>
+                      <span className={sortValue === 1 ? BOOLEAN_BADGE_YES : BOOLEAN_BADGE_NO}>
                         {display}
                       </span>
                     ) : (
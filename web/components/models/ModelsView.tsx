@@ -1,16 +1,27 @@
 'use client'
 
 import { useState, useMemo, useEffect } from 'react'
+import dynamic from 'next/dynamic'
 import { useModels, Model } from '@/lib/hooks'
 import { Card, CardContent } from '@/components/ui/card'
 import { ModelCard } from './ModelCard'
 import { ModelsComparisonTable } from './ModelsComparisonTable'
 import { ColumnSelector } from './ColumnSelector'
-import { ModelAnalytics } from './ModelAnalytics'
 import { Search, Filter, X, LayoutGrid, List, Table, ChevronDown, ChevronUp, DollarSign, BarChart3, ListX } from 'lucide-react'
 import { cn } from '@/lib/utils'
 import { ModelType, loadColumnPreferences } from './columnConfig'
 
+// Analytics pulls in recharts; load it only when the tab is opened.
+const ModelAnalytics = dynamic(
+  () => import('./ModelAnalytics').then((m) => m.ModelAnalytics),
+  {
+    ssr: false,
+    loading: () => <div className="animate-pulse text-muted-foreground">Loading analytics…</div>,
+  }
+)
+
+const SELECT_CLASS = 'px-3 py-2 rounded-md border border-input bg-background text-foreground focus:outline-none focus:ring-2 focus:ring-ring'
+
 type ViewMode = 'grid' | 'list' | 'table'
 type SortMode = 'name' | 'type' | 'context'
 type TabMode = 'browse' | 'analytics'
@@ -44,55 +55,57 @@ export function ModelsView() {
   const models = useMemo(() => data?.models || [], [data])
   const types = useMemo(() => data?.types || [], [data])
 
-  const allTraits = useMemo(() => {
-    const traits = new Set<string>()
+  // Flatten each model's traits once per data load; the trait list, search
+  // and trait filter all read from this instead of re-walking the spec.
+  const modelTraits = useMemo(() => {
+    const byModel = new Map<Model, string[]>()
     models.forEach((model: Model) => {
       const modelSpec = model.model_spec || model.spec || {}
       const traitsRaw = modelSpec.traits || model.spec?.traits || {}
-      if (Array.isArray(traitsRaw)) {
-        traitsRaw.forEach((trait) => { traits.add(trait) })
-      } else {
-        Object.keys(traitsRaw).forEach((trait) => { traits.add(trait) })
-      }
+      byModel.set(model, Array.isArray(traitsRaw) ? traitsRaw : Object.keys(traitsRaw))
     })
-    return Array.from(traits).sort()
+    return byModel
   }, [models])
 
+  const allTraits = useMemo(() => {
+    const traits = new Set<string>()
+    modelTraits.forEach((modelTraitList) => {
+      modelTraitList.forEach((trait) => { traits.add(trait) })
+    })
+    return Array.from(traits).sort()
+  }, [modelTraits])
+
+  // Lowercased search text per model, built once per data load so each
+  // keystroke is a single substring check per model.
+  const searchIndex = useMemo(() => {
+    const byModel = new Map<Model, string>()
+    models.forEach((model: Model) => {
+      const modelSpec = model.model_spec || model.spec || {}
+      const capabilities = modelSpec.capabilities || model.spec?.capabilities || {}
+      byModel.set(model, [
+        model.id?.toLowerCase() || '',
+        model.owned_by?.toLowerCase() || '',
+        (modelTraits.get(model) || []).join(' ').toLowerCase(),
+        Object.keys(capabilities).join(' ').toLowerCase(),
+      ].join('\n'))
+    })
+    return byModel
+  }, [models, modelTraits])
+
   const filteredModels = useMemo(() => {
-    let result = [...models]
+    const predicates: Array<(model: Model) => boolean> = []
 
     if (search) {
       const searchLower = search.toLowerCase()
-      result = result.filter((model: Model) => {
-        const modelId = model.id?.toLowerCase()
-        const ownedBy = model.owned_by?.toLowerCase() || ''
-        const modelSpec = model.model_spec || model.spec || {}
-        const traitsRaw = modelSpec.traits || model.spec?.traits || {}
-        const capabilities = modelSpec.capabilities || model.spec?.capabilities || {}
-        
-        const traits = Array.isArray(traitsRaw) ? traitsRaw.join(' ') : Object.keys(traitsRaw).join(' ')
-        const capKeys = Object.keys(capabilities).join(' ').toLowerCase()
-        
-        return modelId.includes(searchLower) ||
-               ownedBy.includes(searchLower) ||
-               traits.toLowerCase().includes(searchLower) ||
-               capKeys.includes(searchLower)
-      })
+      predicates.push((model: Model) => (searchIndex.get(model) || '').includes(searchLower))
     }
 
     if (typeFilter !== 'all') {
-      result = result.filter((model: Model) => (model.type || model.model_type) === typeFilter)
+      predicates.push((model: Model) => (model.type || model.model_type) === typeFilter)
     }
 
     if (traitFilter !== 'all') {
-      result = result.filter((model: Model) => {
-        const modelSpec = model.model_spec || model.spec || {}
-        const traitsRaw = modelSpec.traits || model.spec?.traits || {}
-        if (Array.isArray(traitsRaw)) {
-          return traitsRaw.includes(traitFilter)
-        }
-        return traitFilter in traitsRaw
-      })
+      predicates.push((model: Model) => (modelTraits.get(model) || []).includes(traitFilter))
     }
 
     const activeCapabilities = Object.entries(capabilityFilter)
@@ -100,7 +113,7 @@ export function ModelsView() {
       .map(([key]) => key)
 
     if (activeCapabilities.length > 0) {
-      result = result.filter((model: Model) => {
+      predicates.push((model: Model) => {
         const modelSpec = model.model_spec || model.spec || {}
         const flatCaps = (model as unknown as Record<string, unknown>).capabilities
         const capabilities: Record<string, unknown> = {
@@ -124,7 +137,7 @@ export function ModelsView() {
     if (maxPriceFilter) {
       const maxPrice = parseFloat(maxPriceFilter)
       if (!Number.isNaN(maxPrice)) {
-        result = result.filter((model: Model) => {
+        predicates.push((model: Model) => {
           const modelSpec = model.model_spec || model.spec || {}
           const pricing = modelSpec.pricing || model.spec?.pricing || {}
           const flatModel = model as unknown as Record<string, unknown>
@@ -148,6 +161,12 @@ export function ModelsView() {
       }
     }
 
+    // One pass over the models for all active filters; with none active this
+    // is just the copy the in-place sort below needs.
+    const result = predicates.length === 0
+      ? [...models]
+      : models.filter((model: Model) => predicates.every((matches) => matches(model)))
+
     result.sort((a: Model, b: Model) => {
       switch (sortMode) {
         case 'name':
@@ -169,7 +188,7 @@ export function ModelsView() {
     })
 
     return result
-  }, [models, search, typeFilter, traitFilter, sortMode, capabilityFilter, maxPriceFilter])
+  }, [models, modelTraits, searchIndex, search, typeFilter, traitFilter, sortMode, capabilityFilter, maxPriceFilter])
 
   const activeFilters = (typeFilter !== 'all' ? 1 : 0) + 
     (traitFilter !== 'all' ? 1 : 0) + 
@@ -305,7 +324,7 @@ export function ModelsView() {
             <select
               value={typeFilter}
               onChange={(e) => setTypeFilter(e.target.value)}
-              className="px-3 py-2 rounded-md border border-input bg-background text-foreground focus:outline-none focus:ring-2 focus:ring-ring"
+              className={SELECT_CLASS}
             >
               <option value="all">All Types</option>
               {types.map((type) => (
@@ -318,7 +337,7 @@ export function ModelsView() {
             <select
               value={traitFilter}
               onChange={(e) => setTraitFilter(e.target.value)}
-              className="px-3 py-2 rounded-md border border-input bg-background text-foreground focus:outline-none focus:ring-2 focus:ring-ring"
+              className={SELECT_CLASS}
             >
               <option value="all">All Traits</option>
               {allTraits.map((trait) => (
@@ -331,7 +350,7 @@ export function ModelsView() {
             <select
               value={sortMode}
               onChange={(e) => setSortMode(e.target.value as SortMode)}
-              className="px-3 py-2 rounded-md border border-input bg-background text-foreground focus:outline-none focus:ring-2 focus:ring-ring"
+              className={SELECT_CLASS}
             >
               <option value="name">Sort by Name</option>
               <option value="type">Sort by Type</option>
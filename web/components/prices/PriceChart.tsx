@@ -1,8 +1,9 @@
 'use client'
 
-import { useState } from 'react'
+import { memo, useMemo, useState } from 'react'
 import { usePriceHistory } from '@/lib/hooks'
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/components/ui/card'
+import { formatMonthDay, formatMonthDayHour } from '@/lib/utils'
 import {
   LineChart,
   Line,
@@ -15,23 +16,26 @@ import {
 
 const RANGES = ['24h', '7d', '30d', '90d'] as const
 
-export function PriceChart() {
+// Memoised: the chart takes no props, so parent re-renders (e.g. the
+// portfolio currency toggle in PricesView) never re-render recharts.
+export const PriceChart = memo(function PriceChart() {
   const [token, setToken] = useState<'vvv' | 'diem'>('vvv')
   const [range, setRange] = useState<(typeof RANGES)[number]>('7d')
   const { data, isLoading, isError } = usePriceHistory(token, range)
 
-  const chartData =
-    data?.data.map((p) => ({
-      time: p.timestamp
-        ? new Date(p.timestamp).toLocaleString('en-US', {
-            month: 'short',
-            day: 'numeric',
-            hour: range === '24h' ? 'numeric' : undefined,
-          })
-        : '',
-      usd: p.price_usd,
-      aud: p.price_aud,
-    })) ?? []
+  const chartData = useMemo(
+    () =>
+      data?.data.map((p) => ({
+        time: p.timestamp
+          ? range === '24h'
+            ? formatMonthDayHour(p.timestamp)
+            : formatMonthDay(p.timestamp)
+          : '',
+        usd: p.price_usd,
+        aud: p.price_aud,
+      })) ?? [],
+    [data, range]
+  )
 
   return (
     <Card>
@@ -116,4 +120,4 @@ export function PriceChart() {
       </CardContent>
     </Card>
   )
-}
+})
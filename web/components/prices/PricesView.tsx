@@ -1,6 +1,6 @@
 'use client'
 
-import { useState } from 'react'
+import { memo, useState } from 'react'
 import { usePrices } from '@/lib/hooks'
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/components/ui/card'
 import { formatCurrency, formatNumber } from '@/lib/utils'
@@ -9,6 +9,74 @@ import { PriceChart } from '@/components/prices/PriceChart'
 
 type Currency = 'USD' | 'AUD'
 
+interface TokenPriceCardProps {
+  title: string
+  description: string
+  symbol: string
+  priceUsd: number
+  priceAud?: number
+  holdings: number
+  valueUsd: number
+  valueAud: number | null
+}
+
+// Props are all primitives, so memo skips the card entirely when a refetch
+// returns the same prices or only the portfolio currency toggle changes.
+const TokenPriceCard = memo(function TokenPriceCard({
+  title,
+  description,
+  symbol,
+  priceUsd,
+  priceAud,
+  holdings,
+  valueUsd,
+  valueAud,
+}: TokenPriceCardProps) {
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle className="flex items-center gap-2">
+          <Coins className="w-5 h-5" />
+          {title}
+        </CardTitle>
+        <CardDescription>{description}</CardDescription>
+      </CardHeader>
+      <CardContent className="space-y-4">
+        <div className="grid grid-cols-2 gap-4">
+          <div>
+            <p className="text-sm text-muted-foreground">Price (USD)</p>
+            <p className="text-3xl font-bold text-foreground">
+              {formatCurrency(priceUsd)}
+            </p>
+          </div>
+          {priceAud != null && (
+            <div>
+              <p className="text-sm text-muted-foreground">Price (AUD)</p>
+              <p className="text-3xl font-bold text-foreground">
+                {formatCurrency(priceAud, 'AUD')}
+              </p>
+            </div>
+          )}
+        </div>
+        <div className="pt-4 border-t border-border">
+          <p className="text-sm text-muted-foreground mb-1">Your Holdings</p>
+          <p className="text-xl font-semibold text-foreground">
+            {formatNumber(holdings)} {symbol}
+          </p>
+          <p className="text-sm text-muted-foreground mt-1">
+            ≈ {formatCurrency(valueUsd)}
+          </p>
+          {valueAud != null && (
+            <p className="text-sm text-muted-foreground mt-0.5">
+              ≈ {formatCurrency(valueAud, 'AUD')}
+            </p>
+          )}
+        </div>
+      </CardContent>
+    </Card>
+  )
+})
+
 export function PricesView() {
   const { data: prices, isLoading, isError } = usePrices()
   const [portfolioCurrency, setPortfolioCurrency] = useState<Currency>('USD')
@@ -58,89 +126,26 @@ export function PricesView() {
       </div>
       
       <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
-        <Card>
-          <CardHeader>
-            <CardTitle className="flex items-center gap-2">
-              <Coins className="w-5 h-5" />
-              VVV Token
-            </CardTitle>
-            <CardDescription>Venice Token</CardDescription>
-          </CardHeader>
-          <CardContent className="space-y-4">
-            <div className="grid grid-cols-2 gap-4">
-              <div>
-                <p className="text-sm text-muted-foreground">Price (USD)</p>
-                <p className="text-3xl font-bold text-foreground">
-                  {formatCurrency(vvvPrice)}
-                </p>
-              </div>
-              {vvvAud != null && (
-                <div>
-                  <p className="text-sm text-muted-foreground">Price (AUD)</p>
-                  <p className="text-3xl font-bold text-foreground">
-                    {formatCurrency(vvvAud, 'AUD')}
-                  </p>
-                </div>
-              )}
-            </div>
-            <div className="pt-4 border-t border-border">
-              <p className="text-sm text-muted-foreground mb-1">Your Holdings</p>
-              <p className="text-xl font-semibold text-foreground">
-                {formatNumber(vvvHoldings)} VVV
-              </p>
-              <p className="text-sm text-muted-foreground mt-1">
-                ≈ {formatCurrency(vvvValueUsd)}
-              </p>
-              {vvvValueAud != null && (
-                <p className="text-sm text-muted-foreground mt-0.5">
-                  ≈ {formatCurrency(vvvValueAud, 'AUD')}
-                </p>
-              )}
-            </div>
-          </CardContent>
-        </Card>
-        
-        <Card>
-          <CardHeader>
-            <CardTitle className="flex items-center gap-2">
-              <Coins className="w-5 h-5" />
-              DIEM Token
-            </CardTitle>
-            <CardDescription>Venice Credit Token</CardDescription>
-          </CardHeader>
-          <CardContent className="space-y-4">
-            <div className="grid grid-cols-2 gap-4">
-              <div>
-                <p className="text-sm text-muted-foreground">Price (USD)</p>
-                <p className="text-3xl font-bold text-foreground">
-                  {formatCurrency(diemPrice)}
-                </p>
-              </div>
-              {diemAud != null && (
-                <div>
-                  <p className="text-sm text-muted-foreground">Price (AUD)</p>
-                  <p className="text-3xl font-bold text-foreground">
-                    {formatCurrency(diemAud, 'AUD')}
-                  </p>
-                </div>
-              )}
-            </div>
-            <div className="pt-4 border-t border-border">
-              <p className="text-sm text-muted-foreground mb-1">Your Holdings</p>
-              <p className="text-xl font-semibold text-foreground">
-                {formatNumber(diemHoldings)} DIEM
-              </p>
-              <p className="text-sm text-muted-foreground mt-1">
-                ≈ {formatCurrency(diemValueUsd)}
-              </p>
-              {diemValueAud != null && (
-                <p className="text-sm text-muted-foreground mt-0.5">
-                  ≈ {formatCurrency(diemValueAud, 'AUD')}
-                </p>
-              )}
-            </div>
-          </CardContent>
-        </Card>
+        <TokenPriceCard
+          title="VVV Token"
+          description="Venice Token"
+          symbol="VVV"
+          priceUsd={vvvPrice}
+          priceAud={vvvAud}
+          holdings={vvvHoldings}
+          valueUsd={vvvValueUsd}
+          valueAud={vvvValueAud}
+        />
+        <TokenPriceCard
+          title="DIEM Token"
+          description="Venice Credit Token"
+          symbol="DIEM"
+          priceUsd={diemPrice}
+          priceAud={diemAud}
+          holdings={diemHoldings}
+          valueUsd={diemValueUsd}
+          valueAud={diemValueAud}
+        />
       </div>
       
       <Card>
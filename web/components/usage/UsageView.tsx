@@ -1,8 +1,9 @@
 'use client'
 
+import { useMemo } from 'react'
 import { useAPIKeysUsage, useEpochUsage, useUsageTrends } from '@/lib/hooks'
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from '@/components/ui/card'
-import { formatNumber, formatCurrency, formatDate } from '@/lib/utils'
+import { formatNumber, formatCurrency, formatDate, formatMonthDayHour } from '@/lib/utils'
 import { BarChart3, Activity, TrendingUp, TrendingDown, Minus } from 'lucide-react'
 import {
   LineChart,
@@ -40,6 +41,22 @@ export function UsageView() {
   const totalDiemUsage = keysUsage?.keys?.reduce((sum, k) => sum + k.diem_usage, 0) || 0
   const totalUsdUsage = keysUsage?.keys?.reduce((sum, k) => sum + k.usd_usage, 0) || 0
 
+  // Top five keys for the distribution bars, with each bar's width resolved
+  // once per data change. Sorts a copy so the cached query data is untouched.
+  const topKeys = useMemo(() => {
+    const keys = keysUsage?.keys
+    if (!keys || keys.length === 0) return []
+    return [...keys]
+      .sort((a, b) => b.diem_usage - a.diem_usage)
+      .slice(0, 5)
+      .map((key) => ({
+        key,
+        barWidth: totalDiemUsage > 0
+          ? `${Math.min((key.diem_usage / totalDiemUsage) * 100, 100)}%`
+          : '0%',
+      }))
+  }, [keysUsage?.keys, totalDiemUsage])
+
   const diemPerUsd = usage && usage.usd > 0 ? usage.diem / usage.usd : 0
 
   const trendPoints = trends?.data ?? []
@@ -62,7 +79,7 @@ export function UsageView() {
   const trend = getUsageTrend()
   const trendChartData = trendPoints.map((p) => ({
     time: p.timestamp
-      ? new Date(p.timestamp).toLocaleString('en-US', { month: 'short', day: 'numeric', hour: 'numeric' })
+      ? formatMonthDayHour(p.timestamp)
       : '',
     diem: p.diem,
     usd: p.usd,
@@ -266,7 +283,7 @@ export function UsageView() {
             </CardContent>
           </Card>
 
-          {keysUsage?.keys && keysUsage.keys.length > 0 && (
+          {topKeys.length > 0 && (
             <Card>
               <CardHeader>
                 <CardTitle>Key Usage Distribution</CardTitle>
@@ -276,35 +293,29 @@ export function UsageView() {
               </CardHeader>
               <CardContent>
                 <div className="space-y-3">
-                  {keysUsage.keys
-                    .sort((a, b) => b.diem_usage - a.diem_usage)
-                    .slice(0, 5)
-                    .map((key, index) => {
-                      const percentage = totalDiemUsage > 0 
-                        ? (key.diem_usage / totalDiemUsage) * 100 
-                        : 0
-                      return (
-                        <div key={key.id} className="flex items-center gap-3">
-                          <span className="text-sm font-medium w-6">{index + 1}.</span>
-                          <div className="flex-1">
-                            <div className="flex items-center justify-between mb-1">
-                              <span className="text-sm font-medium truncate max-w-[200px]">
-                                {key.name}
-                              </span>
-                              <span className="text-sm text-muted-foreground">
-                                {formatNumber(key.diem_usage, 4)} DIEM
-                              </span>
-                            </div>
-                            <div className="h-2 bg-muted rounded-full overflow-hidden">
-                              <div 
-                                className="h-full bg-primary rounded-full transition-all"
-                                style={{ width: `${Math.min(percentage, 100)}%` }}
-                              />
-                            </div>
+                  {topKeys.map(({ key, barWidth }, index) => {
+                    return (
+                      <div key={key.id} className="flex items-center gap-3">
+                        <span className="text-sm font-medium w-6">{index + 1}.</span>
+                        <div className="flex-1">
+                          <div className="flex items-center justify-between mb-1">
+                            <span className="text-sm font-medium truncate max-w-[200px]">
+                              {key.name}
+                            </span>
+                            <span className="text-sm text-muted-foreground">
+                              {formatNumber(key.diem_usage, 4)} DIEM
+                            </span>
+                          </div>
+                          <div className="h-2 bg-muted rounded-full overflow-hidden">
+                            <div 
+                              className="h-full bg-primary rounded-full transition-[width]"
+                              style={{ width: barWidth }}
+                            />
                           </div>
                         </div>
-                      )
-                    })}
+                      </div>
+                    )
+                  })}
                 </div>
               </CardContent>
             </Card>
@@ -32,15 +32,6 @@ export function useBenchmarkModels() {
   })
 }
 
-export function useBenchmarkStatus(jobId: string | null, enabled: boolean) {
-  return useQuery({
-    queryKey: ['benchmarkStatus', jobId],
-    queryFn: () => api.getBenchmarkStatus(jobId!),
-    enabled: enabled && !!jobId,
-    refetchInterval: 3000,
-  })
-}
-
 export function useBalance() {
   return useQuery({
     queryKey: ['balance'],
@@ -49,14 +40,6 @@ export function useBalance() {
   })
 }
 
-export function useDailyUsage(date?: string) {
-  return useQuery({
-    queryKey: ['dailyUsage', date],
-    queryFn: () => api.getDailyUsage(date),
-    refetchInterval: 30000,
-  })
-}
-
 export function useEpochUsage() {
   return useQuery({
     queryKey: ['epochUsage'],
@@ -89,22 +72,6 @@ export function useModels() {
   })
 }
 
-export function useModel(modelId: string) {
-  return useQuery({
-    queryKey: ['model', modelId],
-    queryFn: () => api.get<Model>(`/api/models/${modelId}`),
-    enabled: !!modelId,
-  })
-}
-
-export function useModelTraits() {
-  return useQuery({
-    queryKey: ['modelTraits'],
-    queryFn: api.getModelTraits,
-    staleTime: 5 * 60 * 1000,
-  })
-}
-
 export function usePriceHistory(token: 'vvv' | 'diem' = 'vvv', range: string = '7d') {
   return useQuery({
     queryKey: ['priceHistory', token, range],
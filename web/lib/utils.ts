@@ -5,42 +5,103 @@ export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
 }
 
+// Constructing an Intl.NumberFormat resolves locale data every time, so each
+// distinct currency / decimal count gets one formatter, built on first use.
+const currencyFormatters = new Map<string, Intl.NumberFormat>()
+const numberFormatters = new Map<number, Intl.NumberFormat>()
+
+// Prices only move once a minute upstream, so most refetches re-format the
+// same (currency, value) pair. Results are memoised in a small map that drops
+// its oldest entry once full.
+const CURRENCY_CACHE_LIMIT = 1024
+const formattedCurrency = new Map<string, string>()
+
 export function formatCurrency(value: number, currency: string = 'USD'): string {
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency,
-    minimumFractionDigits: 2,
-    maximumFractionDigits: 4,
-  }).format(value)
+  const key = `${currency}:${value}`
+  const cached = formattedCurrency.get(key)
+  if (cached !== undefined) return cached
+
+  let formatter = currencyFormatters.get(currency)
+  if (!formatter) {
+    formatter = new Intl.NumberFormat('en-US', {
+      style: 'currency',
+      currency,
+      minimumFractionDigits: 2,
+      maximumFractionDigits: 4,
+    })
+    currencyFormatters.set(currency, formatter)
+  }
+  const formatted = formatter.format(value)
+  if (formattedCurrency.size >= CURRENCY_CACHE_LIMIT) {
+    formattedCurrency.delete(formattedCurrency.keys().next().value as string)
+  }
+  formattedCurrency.set(key, formatted)
+  return formatted
 }
 
 export function formatNumber(value: number, decimals: number = 2): string {
-  return new Intl.NumberFormat('en-US', {
-    minimumFractionDigits: decimals,
-    maximumFractionDigits: decimals,
-  }).format(value)
+  let formatter = numberFormatters.get(decimals)
+  if (!formatter) {
+    formatter = new Intl.NumberFormat('en-US', {
+      minimumFractionDigits: decimals,
+      maximumFractionDigits: decimals,
+    })
+    numberFormatters.set(decimals, formatter)
+  }
+  return formatter.format(value)
 }
 
 export function formatPercent(value: number): string {
   return `${value.toFixed(2)}%`
 }
 
+// Shared date formatters, built once. Chart labels format every point, so
+// reusing one Intl.DateTimeFormat avoids a locale lookup per data point.
+const dateFormatter = new Intl.DateTimeFormat('en-US', {
+  year: 'numeric',
+  month: 'short',
+  day: 'numeric',
+})
+
+const dateTimeFormatter = new Intl.DateTimeFormat('en-US', {
+  year: 'numeric',
+  month: 'short',
+  day: 'numeric',
+  hour: '2-digit',
+  minute: '2-digit',
+})
+
+const monthDayFormatter = new Intl.DateTimeFormat('en-US', { month: 'short', day: 'numeric' })
+
+const monthDayHourFormatter = new Intl.DateTimeFormat('en-US', {
+  month: 'short',
+  day: 'numeric',
+  hour: 'numeric',
+})
+
+// Intl.DateTimeFormat#format throws on an invalid Date, whereas the
+// toLocale*String methods it replaces returned 'Invalid Date'.
+function formatWith(formatter: Intl.DateTimeFormat, value: string | number | Date): string {
+  const date = value instanceof Date ? value : new Date(value)
+  return Number.isNaN(date.getTime()) ? 'Invalid Date' : formatter.format(date)
+}
+
 export function formatDate(dateString: string): string {
-  return new Date(dateString).toLocaleDateString('en-US', {
-    year: 'numeric',
-    month: 'short',
-    day: 'numeric',
-  })
+  return formatWith(dateFormatter, dateString)
 }
 
 export function formatDateTime(dateString: string): string {
-  return new Date(dateString).toLocaleString('en-US', {
-    year: 'numeric',
-    month: 'short',
-    day: 'numeric',
-    hour: '2-digit',
-    minute: '2-digit',
-  })
+  return formatWith(dateTimeFormatter, dateString)
+}
+
+/** Short chart label, e.g. "Mar 4". */
+export function formatMonthDay(value: string | number | Date): string {
+  return formatWith(monthDayFormatter, value)
+}
+
+/** Short chart label with hour, e.g. "Mar 4, 3 PM". */
+export function formatMonthDayHour(value: string | number | Date): string {
+  return formatWith(monthDayHourFormatter, value)
 }
 
 export function getUsagePercentile(value: number, max: number): number {
@@ -55,21 +116,27 @@ export function getUsageBarColor(percentile: number): string {
   return 'bg-success'
 }
 
+// Badge class lookups are built once at module load and shared by every
+// badge instead of being rebuilt per render.
+const PRIORITY_STYLES: Record<'high' | 'medium' | 'low', string> = {
+  high: 'bg-destructive/10 text-destructive border-destructive/20',
+  medium: 'bg-warning/10 text-warning border-warning/20',
+  low: 'bg-success/10 text-success border-success/20',
+}
+
+const TYPE_COLORS: Record<string, string> = {
+  text: 'bg-chart-1/10 text-chart-1 border-chart-1/20',
+  image: 'bg-chart-5/10 text-chart-5 border-chart-5/20',
+  audio: 'bg-chart-3/10 text-chart-3 border-chart-3/20',
+  video: 'bg-chart-2/10 text-chart-2 border-chart-2/20',
+}
+
+const DEFAULT_TYPE_COLOR = 'bg-muted text-muted-foreground border-muted'
+
 export function getPriorityStyles(priority: 'high' | 'medium' | 'low'): string {
-  const styles = {
-    high: 'bg-destructive/10 text-destructive border-destructive/20',
-    medium: 'bg-warning/10 text-warning border-warning/20',
-    low: 'bg-success/10 text-success border-success/20',
-  }
-  return styles[priority]
+  return PRIORITY_STYLES[priority]
 }
 
 export function getTypeColor(type: string): string {
-  const typeMap: Record<string, string> = {
-    text: 'bg-chart-1/10 text-chart-1 border-chart-1/20',
-    image: 'bg-chart-5/10 text-chart-5 border-chart-5/20',
-    audio: 'bg-chart-3/10 text-chart-3 border-chart-3/20',
-    video: 'bg-chart-2/10 text-chart-2 border-chart-2/20',
-  }
-  return typeMap[type?.toLowerCase()] || 'bg-muted text-muted-foreground border-muted'
-}
\ No newline at end of file
+  return TYPE_COLORS[type?.toLowerCase()] || DEFAULT_TYPE_COLOR
+}